@@ -49,6 +49,12 @@ sudo apt-get install -y i2c-tools
 echo "Enabling I2C interface..."
 sudo raspi-config nonint do_i2c 0
 
+# Run the I2C bus in Fast-mode (400kHz) - the ADS1115 supports it
+if ! grep -q "^dtparam=i2c_arm_baudrate=" /boot/config.txt; then
+    echo "Setting I2C bus speed to 400kHz..."
+    echo 'dtparam=i2c_arm_baudrate=400000' | sudo tee -a /boot/config.txt
+fi
+
 # Verify Python installation
 echo "Verifying Python installation..."
 python3 --version
@@ -101,7 +107,7 @@ try:
     import RPi.GPIO
     import board
     import busio
-    import adafruit_ads1x15.ads1115
+    import smbus2
     print('✓ All hardware libraries imported successfully')
 except ImportError as e:
     print(f'❌ Hardware library import failed: {e}')
@@ -83,43 +83,59 @@ db.serialize(() => {
   );
 });
 
-// Health check endpoint
-app.get("/health", (req, res) => {
-  res.json({
-    status: "OK",
-    timestamp: new Date().toISOString(),
-    server: "FuseTester HTTP Server",
+// Promise wrapper around db.run for statements without results
+function dbRun(sql) {
+  return new Promise((resolve, reject) => {
+    db.run(sql, (err) => {
+      if (err) {
+        err.database = true;
+        return reject(err);
+      }
+      resolve();
+    });
   });
-});
-
-// POST endpoint to receive fuse data
-app.post("/data", async (req, res) => {
-  try {
-    const { timestamp, device_id, readings, battery, system_info } = req.body;
+}
 
-    console.log(
-      `POST /data - Received timestamp: "${timestamp}" (type: ${typeof timestamp})`
-    );
+// Write transactions run one after another, so statements from concurrent
+// requests never end up inside (or rolled back with) another request's transaction
+let transactionQueue = Promise.resolve();
 
-    // Normalize timestamp to ensure consistent format
-    let normalizedTimestamp;
+function inTransaction(work) {
+  const run = async () => {
+    await dbRun("BEGIN IMMEDIATE");
     try {
-      // Parse and re-format to ensure ISO format with timezone
-      const date = new Date(timestamp);
-      normalizedTimestamp = date.toISOString();
-      console.log(`Normalized timestamp: "${normalizedTimestamp}"`);
+      const result = await work();
+      await dbRun("COMMIT");
+      return result;
     } catch (err) {
-      console.error("Invalid timestamp format:", timestamp);
-      return res.status(400).json({ error: "Invalid timestamp format" });
+      await dbRun("ROLLBACK").catch((rollbackErr) =>
+        console.error("Rollback failed:", rollbackErr.message)
+      );
+      throw err;
     }
+  };
+  const result = transactionQueue.then(run, run);
+  transactionQueue = result.catch(() => {});
+  return result;
+}
 
-    // Validate required fields
-    if (!timestamp || !device_id || !readings) {
-      return res.status(400).json({
-        error: "Missing required fields: timestamp, device_id, readings",
-      });
-    }
+// Check one payload; returns { args } for saveReading() or { error }
+function validateReading({ timestamp, device_id, readings, battery, system_info } = {}) {
+  if (!timestamp || !device_id || !readings) {
+    return { error: "Missing required fields: timestamp, device_id, readings" };
+  }
+
+  const date = new Date(timestamp);
+  if (isNaN(date.getTime())) {
+    return { error: "Invalid timestamp format" };
+  }
 
+  return { args: [date.toISOString(), device_id, readings, battery, system_info] };
+}
+
+// Insert one reading and its individual fuse voltages (call inside inTransaction)
+function saveReading(normalizedTimestamp, device_id, readings, battery, system_info) {
+  return new Promise((resolve, reject) => {
     // Extract system info
     const memoryPercent = system_info?.memory_percent || null;
     const cpuTemp = system_info?.cpu_temp || null;
@@ -146,7 +162,8 @@ app.post("/data", async (req, res) => {
       function (err) {
         if (err) {
           console.error("Database error:", err.message);
-          return res.status(500).json({ error: "Database error" });
+          err.database = true;
+          return reject(err);
         }
 
         const readingId = this.lastID;
@@ -157,18 +174,16 @@ app.post("/data", async (req, res) => {
         let completed = 0;
 
         if (fuseCount === 0) {
-          return res.json({
-            success: true,
-            reading_id: readingId,
-            fuses_recorded: 0,
-            message: "Reading saved (no fuse data)",
-          });
+          return resolve({ readingId, fuseCount });
         }
 
         Object.entries(readings).forEach(([fuseNum, voltage]) => {
           db.run(insertFuse, [readingId, parseInt(fuseNum), voltage], (err) => {
             if (err) {
               console.error("Fuse insert error:", err.message);
+              err.database = true;
+              // The transaction is rolled back, so the reading row goes too
+              return reject(err);
             }
 
             completed++;
@@ -176,20 +191,121 @@ app.post("/data", async (req, res) => {
               console.log(
                 `Saved reading ${readingId}: ${fuseCount} fuses, battery: ${battery}V`
               );
-              res.json({
-                success: true,
-                reading_id: readingId,
-                fuses_recorded: fuseCount,
-                battery_voltage: battery,
-              });
+              resolve({ readingId, fuseCount });
             }
           });
         });
       }
     );
+  });
+}
+
+// Health check endpoint
+app.get("/health", (req, res) => {
+  res.json({
+    status: "OK",
+    timestamp: new Date().toISOString(),
+    server: "FuseTester HTTP Server",
+  });
+});
+
+// POST endpoint to receive fuse data
+app.post("/data", async (req, res) => {
+  try {
+    const { timestamp, device_id, readings, battery, system_info } = req.body;
+
+    console.log(
+      `POST /data - Received timestamp: "${timestamp}" (type: ${typeof timestamp})`
+    );
+
+    // Normalize timestamp to ensure consistent format
+    let normalizedTimestamp;
+    try {
+      // Parse and re-format to ensure ISO format with timezone
+      const date = new Date(timestamp);
+      normalizedTimestamp = date.toISOString();
+      console.log(`Normalized timestamp: "${normalizedTimestamp}"`);
+    } catch (err) {
+      console.error("Invalid timestamp format:", timestamp);
+      return res.status(400).json({ error: "Invalid timestamp format" });
+    }
+
+    // Validate required fields
+    if (!timestamp || !device_id || !readings) {
+      return res.status(400).json({
+        error: "Missing required fields: timestamp, device_id, readings",
+      });
+    }
+
+    const { readingId, fuseCount } = await inTransaction(() =>
+      saveReading(normalizedTimestamp, device_id, readings, battery, system_info)
+    );
+
+    if (fuseCount === 0) {
+      return res.json({
+        success: true,
+        reading_id: readingId,
+        fuses_recorded: 0,
+        message: "Reading saved (no fuse data)",
+      });
+    }
+
+    res.json({
+      success: true,
+      reading_id: readingId,
+      fuses_recorded: fuseCount,
+      battery_voltage: battery,
+    });
   } catch (error) {
     console.error("Error processing data:", error);
-    res.status(500).json({ error: "Internal server error" });
+    res.status(500).json({ error: error.database ? "Database error" : "Internal server error" });
+  }
+});
+
+// POST endpoint to receive several buffered payloads in one request
+app.post("/data/batch", async (req, res) => {
+  try {
+    const { batch } = req.body;
+
+    if (!Array.isArray(batch)) {
+      return res.status(400).json({ error: "Missing required field: batch" });
+    }
+
+    console.log(`POST /data/batch - Received ${batch.length} payloads`);
+
+    // Invalid entries are reported back instead of failing the batch: resending
+    // them would never succeed, and the valid readings would be stuck behind them
+    const valid = [];
+    const rejected = [];
+    batch.forEach((entry, index) => {
+      const { args, error } = validateReading(entry);
+      if (error) {
+        console.error(`Rejected batch entry ${index}: ${error}`);
+        rejected.push({ index, error });
+      } else {
+        valid.push(args);
+      }
+    });
+
+    // All or nothing, so a retry after a database error cannot store duplicates
+    const readingIds = await inTransaction(async () => {
+      const ids = [];
+      for (const args of valid) {
+        const { readingId } = await saveReading(...args);
+        ids.push(readingId);
+      }
+      return ids;
+    });
+
+    res.json({
+      success: true,
+      readings_recorded: readingIds.length,
+      reading_ids: readingIds,
+      rejected,
+    });
+  } catch (error) {
+    console.error("Error processing batch:", error);
+    res.status(500).json({ error: error.database ? "Database error" : "Internal server error" });
   }
 });
 
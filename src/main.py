@@ -11,9 +11,13 @@ import os
 import sys
 import signal
 import time
+import queue
+import atexit
+import threading
 import logging
+import logging.handlers
 import asyncio
-import psutil
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -24,31 +28,136 @@ from services.fuse_monitor_service import FuseMonitorService
 # Load environment variables
 load_dotenv()
 
+@dataclass(frozen=True)
+class Config:
+    """Application settings snapshotted from the environment at startup"""
+    log_level: str
+    i2c_enabled: bool
+    memory_monitoring: bool
+    csv_file_path: Path
+    
+    @classmethod
+    def from_env(cls) -> 'Config':
+        return cls(
+            log_level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+            i2c_enabled=os.getenv('I2C_ENABLED', 'true').lower() == 'true',
+            memory_monitoring=os.getenv('MEMORY_MONITORING', 'true').lower() == 'true',
+            csv_file_path=Path(os.getenv('CSV_FILE_PATH', './data/fuse_data.csv'))
+        )
+
+CFG = Config.from_env()
+
+# Maximum log records waiting for the writer thread before new ones are dropped
+LOG_QUEUE_SIZE = 10000
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of failing when the queue is full"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+# Main log file rotation and write buffering
+LOG_MAX_BYTES = 1_048_576
+LOG_BACKUP_COUNT = 5
+LOG_BUFFER_SIZE = 4096
+LOG_FLUSH_INTERVAL = 5.0  # seconds
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Size-rotated file handler that batches writes to the SD card
+    
+    Records are buffered and flushed every flush_interval seconds by a helper
+    thread, or immediately for records at flush_level and above. The file size
+    is tracked in memory, so the rollover check costs no seek or stat per record.
+    """
+    
+    def __init__(self, filename, flush_interval: float = LOG_FLUSH_INTERVAL,
+                 flush_level: int = logging.ERROR, **kwargs):
+        self._size = 0
+        super().__init__(filename, **kwargs)
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically,
+                                         name='log-flush', daemon=True)
+        self._flusher.start()
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = stream.tell()
+        return stream
+    
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            self.flush()
+    
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
 # Configure logging
 def setup_logging():
-    """Configure logging with file and console output"""
-    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    """Configure logging with file and console output written from a background thread"""
+    log_level = CFG.log_level
     
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
     
     # Create handlers
-    file_handler = logging.FileHandler('logs/fusetester.log')
+    file_handler = BufferedRotatingFileHandler(
+        'logs/fusetester.log',
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
     error_handler = logging.FileHandler('logs/error.log')
     error_handler.setLevel(logging.ERROR)  # Only log errors and above
     console_handler = logging.StreamHandler(sys.stdout)
     
     # Configure logging format
-    logging.basicConfig(
-        level=getattr(logging, log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            file_handler,
-            error_handler,
-            console_handler
-        ]
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for handler in (file_handler, error_handler, console_handler):
+        handler.setFormatter(formatter)
+    
+    # Log calls only enqueue; disk and console writes happen on the listener thread
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, log_level))
+    root_logger.addHandler(DroppingQueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        error_handler,
+        console_handler,
+        respect_handler_level=True
     )
+    listener.start()
+    
+    # Flush queued records on any exit path (sys.exit is used throughout)
+    atexit.register(file_handler.close)
+    atexit.register(listener.stop)
     
     return logging.getLogger('fusetester')
 
@@ -59,29 +168,46 @@ logger = setup_logging()
 i2c_service = None
 fuse_monitor_service = None
 
+# Set to wake main() for shutdown - created inside main() so it binds to the running loop
+shutdown_event = None
+
+# Page size for /proc/self/statm values
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
 def log_memory_usage():
     """Log current memory usage - critical for Pi 1 B+ with 512MB RAM"""
-    process = psutil.Process()
-    memory_info = process.memory_info()
+    # /proc/self/statm: size resident shared text lib data dt (in pages)
+    with open('/proc/self/statm') as f:
+        vms_pages, rss_pages = f.read().split()[:2]
     
     logger.info(f"Memory Usage: "
-               f"RSS={memory_info.rss / 1024 / 1024:.1f}MB, "
-               f"VMS={memory_info.vms / 1024 / 1024:.1f}MB")
+               f"RSS={int(rss_pages) * PAGE_SIZE / 1024 / 1024:.1f}MB, "
+               f"VMS={int(vms_pages) * PAGE_SIZE / 1024 / 1024:.1f}MB")
     
     # Log system memory if available
     try:
-        system_memory = psutil.virtual_memory()
+        meminfo = {}
+        with open('/proc/meminfo') as f:
+            for line in f:
+                key, value = line.split(':', 1)
+                if key in ('MemTotal', 'MemAvailable'):
+                    meminfo[key] = int(value.split()[0])  # kB
+                    if len(meminfo) == 2:
+                        break
+        
+        total_kb = meminfo['MemTotal']
+        available_kb = meminfo['MemAvailable']
+        used_kb = total_kb - available_kb
         logger.info(f"System Memory: "
-                   f"Used={system_memory.used / 1024 / 1024:.1f}MB, "
-                   f"Available={system_memory.available / 1024 / 1024:.1f}MB, "
-                   f"Percent={system_memory.percent}%")
+                   f"Used={used_kb / 1024:.1f}MB, "
+                   f"Available={available_kb / 1024:.1f}MB, "
+                   f"Percent={used_kb * 100 / total_kb:.1f}%")
     except Exception as e:
         logger.warning(f"Could not get system memory info: {e}")
 
 def create_data_directory():
     """Create data directory if it doesn't exist"""
-    csv_file_path = os.getenv('CSV_FILE_PATH', './data/fuse_data.csv')
-    data_dir = Path(csv_file_path).parent
+    data_dir = CFG.csv_file_path.parent
     
     if not data_dir.exists():
         data_dir.mkdir(parents=True, exist_ok=True)
@@ -98,7 +224,7 @@ async def initialize_services():
     create_data_directory()
     
     # Initialize I2C service if enabled
-    if os.getenv('I2C_ENABLED', 'true').lower() == 'true':
+    if CFG.i2c_enabled:
         try:
             i2c_service = I2CService()
             await i2c_service.initialize()
@@ -149,16 +275,27 @@ async def start_monitoring():
         sys.exit(1)
     
     # Start periodic memory monitoring if enabled
-    if os.getenv('MEMORY_MONITORING', 'true').lower() == 'true':
+    if CFG.memory_monitoring:
         asyncio.create_task(periodic_memory_monitoring())
     
     # Start periodic status logging
     asyncio.create_task(periodic_status_logging())
 
+async def sleep_until(deadline: float):
+    """Sleep until an event loop time deadline"""
+    await asyncio.sleep(max(0.0, deadline - asyncio.get_running_loop().time()))
+
 async def periodic_memory_monitoring():
     """Periodic memory usage logging"""
+    interval = 300  # 5 minutes
+    next_run = asyncio.get_running_loop().time() + interval
     while True:
-        await asyncio.sleep(300)  # 5 minutes
+        # Schedule against the monotonic loop clock so the period does not drift
+        await sleep_until(next_run)
+        next_run += interval
+        
+        # Low priority: let ready ADC callbacks run before doing any work
+        await asyncio.sleep(0)
         try:
             log_memory_usage()
         except Exception as e:
@@ -166,11 +303,17 @@ async def periodic_memory_monitoring():
 
 async def periodic_status_logging():
     """Periodic system status logging"""
+    interval = 600  # 10 minutes
+    next_run = asyncio.get_running_loop().time() + interval
     while True:
-        await asyncio.sleep(600)  # 10 minutes
+        await sleep_until(next_run)
+        next_run += interval
+        
+        await asyncio.sleep(0)
         try:
             if fuse_monitor_service:
                 status = await fuse_monitor_service.get_status()
+                await asyncio.sleep(0)
                 logger.info(f"System status update: "
                            f"monitoring={status.get('monitoring')}, "
                            f"current_mux={status.get('current_mux')}, "
@@ -179,14 +322,15 @@ async def periodic_status_logging():
         except Exception as e:
             logger.warning(f"Error during status logging: {e}")
 
-def shutdown_handler(signum, frame):
-    """Graceful shutdown handler"""
+def shutdown_handler(signum):
+    """Graceful shutdown handler (runs on the event loop via add_signal_handler)"""
     logger.info(f"Received signal {signum}, shutting down gracefully...")
-    asyncio.create_task(shutdown())
+    shutdown_event.set()
 
 async def shutdown():
     """Shutdown all services gracefully"""
     logger.info("Shutting down gracefully...")
+    shutdown_event.set()
     
     try:
         # Stop monitoring
@@ -206,17 +350,21 @@ async def shutdown():
 def handle_exception(loop, context):
     """Global exception handler for asyncio"""
     logger.error(f"Unhandled exception: {context}")
-    asyncio.create_task(shutdown())
+    shutdown_event.set()
 
 async def main():
     """Main application function"""
+    global shutdown_event
+    
     try:
-        # Setup signal handlers
-        signal.signal(signal.SIGTERM, shutdown_handler)
-        signal.signal(signal.SIGINT, shutdown_handler)
+        shutdown_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        
+        # Setup signal handlers on the loop so they run as regular callbacks
+        loop.add_signal_handler(signal.SIGTERM, shutdown_handler, signal.SIGTERM)
+        loop.add_signal_handler(signal.SIGINT, shutdown_handler, signal.SIGINT)
         
         # Set global exception handler
-        loop = asyncio.get_event_loop()
         loop.set_exception_handler(handle_exception)
         
         # Initialize services
@@ -227,13 +375,9 @@ async def main():
         
         logger.info("FuseTester Fuse Monitoring System running successfully")
         
-        # Keep the application running
-        try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
-            logger.info("Keyboard interrupt received")
-            await shutdown()
+        # Idle until a signal or unhandled exception requests shutdown
+        await shutdown_event.wait()
+        await shutdown()
             
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
@@ -245,5 +389,13 @@ if __name__ == "__main__":
         print("Python 3.9 or higher is required", file=sys.stderr)
         sys.exit(1)
     
+    # Use uvloop if available - faster timer and I/O polling on ARM6
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.warning("uvloop not available - using default asyncio event loop")
+    
     # Run the async main function
     asyncio.run(main())
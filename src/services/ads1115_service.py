@@ -1,22 +1,30 @@
 """
 ADS1115 ADC Service
-Handles communication with the ADS1115 16-bit ADC using Adafruit CircuitPython library
+Handles communication with the ADS1115 16-bit ADC using direct smbus2 register access
 Optimized for Raspberry Pi 1 Model B+ ARM6 architecture
 """
 
+import os
 import asyncio
 import logging
-from typing import Dict, Any, Optional
-import board
-import busio
-import adafruit_ads1x15.ads1115 as ADS
-from adafruit_ads1x15.analog_in import AnalogIn
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from smbus2 import SMBus, i2c_msg
+
+try:
+    import pigpio  # Only needed for ALERT/RDY interrupt-driven continuous mode
+except ImportError:
+    pigpio = None
 
 logger = logging.getLogger(__name__)
 
 # ADS1115 I2C address (default)
 ADS1115_ADDRESS = 0x48
 
+# Linux I2C bus number (/dev/i2c-1). Bus speed is set by dtparam=i2c_arm_baudrate in /boot/config.txt
+I2C_BUS = 1
+
 # Gain settings for different voltage ranges (using raw gain values)
 GAIN_SETTINGS = {
     '6.144V': 2/3,  # +/-6.144V range (TWOTHIRDS)
@@ -27,16 +35,97 @@ GAIN_SETTINGS = {
     '0.256V': 16    # +/-0.256V range (SIXTEEN)
 }
 
+# Reverse lookup of GAIN_SETTINGS for status/log output
+_GAIN_TO_RANGE = {gain: voltage_range for voltage_range, gain in GAIN_SETTINGS.items()}
+
+# Full-scale voltage for each raw gain value
+GAIN_FULL_SCALE = {
+    2/3: 6.144,
+    1: 4.096,
+    2: 2.048,
+    4: 1.024,
+    8: 0.512,
+    16: 0.256
+}
+
+# Default data rate (samples per second)
+DEFAULT_DATA_RATE = 128
+
+# Extra wait on top of the conversion period to cover I2C transaction time
+I2C_MARGIN_S = 100e-6
+
+# Internal oscillator tolerance: actual data rate may be up to 10% below nominal
+OSC_TOLERANCE = 1.1
+
+# Register pointers
+_REG_CONVERSION = 0x00
+_REG_CONFIG = 0x01
+_REG_LO_THRESH = 0x02
+_REG_HI_THRESH = 0x03
+
+# Config register bits
+_CONFIG_OS_SINGLE = 0x8000        # Write: start single conversion, read: conversion complete
+_CONFIG_MUX_SINGLE = (0x4000, 0x5000, 0x6000, 0x7000)  # AIN0-AIN3 vs GND
+_CONFIG_MODE_SINGLE = 0x0100
+_CONFIG_COMP_QUE_DISABLE = 0x0003
+_CONFIG_COMP_QUE_ONE = 0x0000     # Assert ALERT/RDY after every conversion
+
+_CONFIG_GAIN_MASK = 0x0E00
+_CONFIG_GAIN = {
+    2/3: 0x0000,
+    1: 0x0200,
+    2: 0x0400,
+    4: 0x0600,
+    8: 0x0800,
+    16: 0x0A00
+}
+
+_CONFIG_DATA_RATE = {
+    8: 0x0000,
+    16: 0x0020,
+    32: 0x0040,
+    64: 0x0060,
+    128: 0x0080,
+    250: 0x00A0,
+    475: 0x00C0,
+    860: 0x00E0
+}
+
 class ADS1115Service:
-    """ADS1115 16-bit ADC service using Adafruit CircuitPython library"""
+    """ADS1115 16-bit ADC service using direct smbus2 register access"""
     
-    def __init__(self, address: int = ADS1115_ADDRESS):
+    def __init__(self, address: int = ADS1115_ADDRESS, rdy_gpio: Optional[int] = None):
         self.address = address
+        self.rdy_gpio = rdy_gpio
         self.initialized = False
-        self.ads: Optional[ADS.ADS1115] = None
-        self.i2c: Optional[busio.I2C] = None
+        self.i2c: Optional[SMBus] = None
         self.current_gain = 1  # Default to +/-4.096V range (ONE)
-        self.channels: Dict[int, AnalogIn] = {}
+        self.data_rate = DEFAULT_DATA_RATE
+        self._v_per_bit = GAIN_FULL_SCALE[self.current_gain] / 32767.0
+        
+        # Single worker keeps I2C transactions ordered while keeping them off the event loop
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Pre-built config words, only the MUX bits differ per channel
+        self._conversion_time_s = 1.0 / self.data_rate
+        self._config_words = self._build_config_words()
+        
+        # Continuous conversion mode driven by the ALERT/RDY pin
+        self.continuous = False
+        self._continuous_config_words = self._build_continuous_config_words()
+        self._continuous_channel: Optional[int] = None
+        
+        # Free-running continuous conversions polled without the RDY pin
+        self.free_running = False
+        
+        # Conversion started by start_conversion() and not yet read
+        self._pending_channel: Optional[int] = None
+        self._pending_started = 0.0
+        self._pi = None
+        self._pi_i2c: Optional[int] = None
+        self._rdy_callback = None
+        self._rdy_queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     async def initialize(self):
         """Initialize connection to ADS1115"""
@@ -47,18 +136,25 @@ class ADS1115Service:
         try:
             logger.info(f"Initializing ADS1115 at address 0x{self.address:02x}...")
             
-            # Create I2C bus
-            self.i2c = busio.I2C(board.SCL, board.SDA, frequency=100000)
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ads1115-io')
             
-            # Create ADS1115 instance
-            self.ads = ADS.ADS1115(self.i2c, address=self.address, gain=self.current_gain)
+            # Open a persistent handle on the I2C bus
+            self.i2c = SMBus(I2C_BUS)
             
             # Test connection by reading configuration
-            await self.test_connection()
+            if not await self.test_connection():
+                raise RuntimeError(f"No response from ADS1115 at address 0x{self.address:02x}")
+            
+            # Switch to continuous mode if the ALERT/RDY pin is wired up
+            if self.rdy_gpio is None and os.getenv('ADS1115_RDY_GPIO'):
+                self.rdy_gpio = int(os.getenv('ADS1115_RDY_GPIO'))
+            if self.rdy_gpio is not None:
+                self._start_continuous_mode()
             
             self.initialized = True
             logger.info("ADS1115 ADC initialized successfully")
             logger.info(f"Current gain setting: {self._gain_to_voltage_range(self.current_gain)}")
+            logger.info(f"Conversion mode: {'continuous (RDY interrupt)' if self.continuous else 'single-shot'}")
             
         except Exception as e:
             logger.error(f"Failed to initialize ADS1115: {e}")
@@ -67,14 +163,14 @@ class ADS1115Service:
     
     async def test_connection(self) -> bool:
         """Test connection to ADS1115"""
-        if not self.ads:
+        if not self.i2c:
             return False
         
         try:
-            # Try to read from channel 0 to test connection
-            test_channel = AnalogIn(self.ads, ADS.P0)
-            test_value = test_channel.value
-            logger.debug(f"ADS1115 connection test successful, test value: {test_value}")
+            # Read the config register - does not disturb the conversion mode
+            config = await self._run_io(self._read_register, _REG_CONFIG)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ADS1115 connection test successful, config: 0x%04x", config)
             return True
             
         except Exception as e:
@@ -94,12 +190,21 @@ class ADS1115Service:
         if gain_setting not in GAIN_SETTINGS:
             raise ValueError(f"Invalid gain setting. Must be one of: {list(GAIN_SETTINGS.keys())}")
         
+        gain = GAIN_SETTINGS[gain_setting]
+        if gain == self.current_gain:
+            return
+        
         try:
-            self.current_gain = GAIN_SETTINGS[gain_setting]
-            self.ads.gain = self.current_gain
+            self.current_gain = gain
+            self._v_per_bit = GAIN_FULL_SCALE[gain] / 32767.0
             
-            # Clear cached channels since gain changed
-            self.channels.clear()
+            # Only the PGA bits change; patch them into the pre-built config words
+            pga = _CONFIG_GAIN[gain]
+            self._config_words = tuple((word & ~_CONFIG_GAIN_MASK) | pga
+                                       for word in self._config_words)
+            self._continuous_config_words = tuple((word & ~_CONFIG_GAIN_MASK) | pga
+                                                  for word in self._continuous_config_words)
+            self._continuous_channel = None
             
             logger.info(f"ADS1115 gain set to {gain_setting}")
             
@@ -107,23 +212,379 @@ class ADS1115Service:
             logger.error(f"Failed to set ADS1115 gain: {e}")
             raise
     
+    def set_data_rate(self, data_rate: int):
+        """
+        Set the conversion data rate
+        
+        Args:
+            data_rate: Samples per second (8, 16, 32, 64, 128, 250, 475, 860)
+        """
+        if not self.initialized:
+            raise RuntimeError("ADS1115 service not initialized")
+        
+        if data_rate not in _CONFIG_DATA_RATE:
+            raise ValueError(f"Invalid data rate. Must be one of: {list(_CONFIG_DATA_RATE.keys())}")
+        
+        try:
+            self.data_rate = data_rate
+            
+            # Inter-sample waits follow the conversion period
+            self._conversion_time_s = 1.0 / data_rate
+            
+            # Rebuild config words with the new DR setting
+            self._config_words = self._build_config_words()
+            self._continuous_config_words = self._build_continuous_config_words()
+            self._continuous_channel = None
+            
+            logger.info(f"ADS1115 data rate set to {data_rate} SPS")
+            
+        except Exception as e:
+            logger.error(f"Failed to set ADS1115 data rate: {e}")
+            raise
+    
+    @property
+    def conversion_time(self) -> float:
+        """Worst-case duration of one conversion at the current data rate, in seconds"""
+        return self._conversion_time_s * OSC_TOLERANCE
+    
     def _gain_to_voltage_range(self, gain) -> str:
         """Convert gain value to voltage range string"""
-        for voltage_range, gain_value in GAIN_SETTINGS.items():
-            if gain_value == gain:
-                return voltage_range
-        return "unknown"
+        return _GAIN_TO_RANGE.get(gain, "unknown")
+    
+    def _build_config_words(self) -> tuple:
+        """Pre-build single-shot config words for channels 0-3 (only the MUX bits differ)"""
+        template = (_CONFIG_OS_SINGLE |
+                    _CONFIG_GAIN[self.current_gain] |
+                    _CONFIG_MODE_SINGLE |
+                    _CONFIG_DATA_RATE[self.data_rate] |
+                    _CONFIG_COMP_QUE_DISABLE)
+        return tuple(template | mux for mux in _CONFIG_MUX_SINGLE)
+    
+    def _build_continuous_config_words(self) -> tuple:
+        """Pre-build continuous-mode config words for channels 0-3 with RDY on every conversion"""
+        template = (_CONFIG_GAIN[self.current_gain] |
+                    _CONFIG_DATA_RATE[self.data_rate] |
+                    _CONFIG_COMP_QUE_ONE)
+        return tuple(template | mux for mux in _CONFIG_MUX_SINGLE)
+    
+    async def _run_io(self, func, *args):
+        """Run a blocking I2C call on the dedicated I/O thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._io_executor, func, *args)
+    
+    def _write_register(self, register: int, value: int):
+        """Write a 16-bit register"""
+        self.i2c.write_i2c_block_data(self.address, register, [(value >> 8) & 0xFF, value & 0xFF])
+    
+    def _write_config(self, config: int):
+        """Write a 16-bit word to the config register"""
+        self._write_register(_REG_CONFIG, config)
+    
+    def _read_register(self, register: int) -> int:
+        """Read a 16-bit register (pointer write + data read combined in one ioctl)"""
+        write = i2c_msg.write(self.address, [register])
+        read = i2c_msg.read(self.address, 2)
+        self.i2c.i2c_rdwr(write, read)
+        high_byte, low_byte = list(read)
+        return (high_byte << 8) | low_byte
+    
+    def _read_conversion(self) -> int:
+        """Read the conversion register as a signed 16-bit value"""
+        value = self._read_register(_REG_CONVERSION)
+        return value - 0x10000 if value & 0x8000 else value
+    
+    def _read_if_ready(self, next_config: Optional[int] = None) -> Optional[int]:
+        """
+        Read the conversion register if the OS bit reports the conversion complete
+        
+        The optional next config write follows the conversion read in the same
+        I/O-thread call, as its own transfer: i2c-bcm2835 only accepts a read as
+        the last message of an i2c_rdwr transaction.
+        
+        Args:
+            next_config: Config word to write right after the conversion read
+            
+        Returns:
+            Signed raw 16-bit ADC reading, or None if still converting
+        """
+        if not self._read_register(_REG_CONFIG) & _CONFIG_OS_SINGLE:
+            return None
+        
+        value = self._read_conversion()
+        if next_config is not None:
+            self._write_config(next_config)
+        return value
+    
+    async def _await_conversion(self, channel: int, next_config: Optional[int] = None,
+                                started: Optional[float] = None) -> int:
+        """
+        Wait for a triggered single-shot conversion and read the result
+        
+        Waits the nominal conversion time for the current data rate, then polls
+        the config register OS bit in case the internal oscillator runs slow.
+        
+        Args:
+            channel: ADC channel being converted (0-3)
+            next_config: Config word to write once the result has been read
+            started: time.monotonic() at which the conversion was triggered (default: now)
+            
+        Returns:
+            Signed raw 16-bit ADC reading
+        """
+        wait = self._conversion_time_s + I2C_MARGIN_S
+        if started is not None:
+            wait -= time.monotonic() - started
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        deadline = time.monotonic() + self._conversion_time_s
+        while True:
+            value = await self._run_io(self._read_if_ready, next_config)
+            if value is not None:
+                return value
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Conversion on channel {channel} did not complete")
+            await asyncio.sleep(self._conversion_time_s / 10)
+    
+    async def _convert(self, channel: int) -> int:
+        """
+        Trigger a single-shot conversion and read the result
+        
+        Args:
+            channel: ADC channel (0-3)
+            
+        Returns:
+            Signed raw 16-bit ADC reading
+        """
+        # A single-shot config write ends any free-running conversions
+        self.free_running = False
+        await self._run_io(self._write_config, self._config_words[channel])
+        return await self._await_conversion(channel)
+    
+    def _start_continuous_mode(self):
+        """
+        Put the ADS1115 in continuous mode with ALERT/RDY as a conversion-ready pin
+        
+        A pigpio edge callback reads each conversion the moment it is ready and
+        hands it to the event loop through an asyncio.Queue. Falls back to
+        single-shot mode if pigpio or the pigpio daemon is unavailable.
+        """
+        if pigpio is None:
+            logger.warning("pigpio not installed - staying in single-shot mode")
+            return
+        
+        pi = pigpio.pi()
+        if not pi.connected:
+            logger.warning("pigpio daemon not running - staying in single-shot mode")
+            pi.stop()  # Releases the handle and its notification thread
+            return
+        
+        # Owned from here on, so _stop_continuous_mode() releases it on any failure
+        self._pi = pi
+        
+        try:
+            # Hi_thresh MSB=1 and Lo_thresh MSB=0 turns ALERT/RDY into a conversion-ready pin
+            self._write_register(_REG_HI_THRESH, 0x8000)
+            self._write_register(_REG_LO_THRESH, 0x0000)
+            
+            self._loop = asyncio.get_running_loop()
+            self._rdy_queue = asyncio.Queue(maxsize=4)
+            self._pi_i2c = pi.i2c_open(I2C_BUS, self.address)
+            
+            # ALERT/RDY is open-drain and pulses low at the end of each conversion
+            pi.set_mode(self.rdy_gpio, pigpio.INPUT)
+            pi.set_pull_up_down(self.rdy_gpio, pigpio.PUD_UP)
+            self._rdy_callback = pi.callback(self.rdy_gpio, pigpio.FALLING_EDGE, self._on_rdy)
+            
+            self._write_config(self._continuous_config_words[0])
+            self._continuous_channel = 0
+            self.continuous = True
+            logger.info(f"ADS1115 continuous mode enabled (RDY on GPIO{self.rdy_gpio})")
+            
+        except Exception as e:
+            logger.warning(f"Failed to enable continuous mode, staying in single-shot: {e}")
+            self._stop_continuous_mode()
+    
+    def _stop_continuous_mode(self):
+        """Detach the RDY callback and return the ADS1115 to single-shot mode"""
+        if self._rdy_callback:
+            self._rdy_callback.cancel()
+            self._rdy_callback = None
+        
+        if self._pi:
+            try:
+                if self._pi_i2c is not None:
+                    self._pi.i2c_close(self._pi_i2c)
+            except Exception as e:
+                logger.warning(f"Error closing pigpio I2C handle: {e}")
+            self._pi.stop()
+            self._pi = None
+            self._pi_i2c = None
+        
+        if self.continuous and self.i2c:
+            try:
+                # Single-shot config without OS set powers the chip down
+                self._write_config(self._config_words[0] & ~_CONFIG_OS_SINGLE)
+            except Exception as e:
+                logger.warning(f"Error leaving continuous mode: {e}")
+        
+        self.continuous = False
+        self._continuous_channel = None
+        self._rdy_queue = None
+    
+    def _on_rdy(self, gpio: int, level: int, tick: int):
+        """pigpio callback (runs on the pigpio thread) for each conversion-ready edge"""
+        try:
+            # SMBus words are little-endian, the ADS1115 sends MSB first
+            word = self._pi.i2c_read_word_data(self._pi_i2c, _REG_CONVERSION)
+        except Exception:
+            return
+        
+        value = ((word & 0xFF) << 8) | (word >> 8)
+        if value & 0x8000:
+            value -= 0x10000
+        
+        self._loop.call_soon_threadsafe(self._deliver_conversion, value)
+    
+    def _deliver_conversion(self, value: int):
+        """Queue a conversion result, dropping the oldest one if nobody is reading"""
+        queue = self._rdy_queue
+        if queue is None:
+            return
+        
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(value)
     
-    def _get_channel(self, channel_num: int) -> AnalogIn:
-        """Get or create AnalogIn channel instance"""
-        if channel_num not in self.channels:
-            channel_pins = [ADS.P0, ADS.P1, ADS.P2, ADS.P3]
-            if not 0 <= channel_num <= 3:
-                raise ValueError("Channel must be 0-3")
+    async def _read_continuous(self, channel: int) -> int:
+        """
+        Read the next conversion for a channel in continuous mode
+        
+        Args:
+            channel: ADC channel (0-3)
             
-            self.channels[channel_num] = AnalogIn(self.ads, channel_pins[channel_num])
+        Returns:
+            Signed raw 16-bit ADC reading
+        """
+        queue = self._rdy_queue
+        
+        if channel != self._continuous_channel:
+            await self._run_io(self._write_config, self._continuous_config_words[channel])
+            self._continuous_channel = channel
+            skip = 1  # The conversion in flight may still be on the old channel
+        else:
+            skip = 0
+        
+        # Discard conversions that completed before this call
+        while not queue.empty():
+            queue.get_nowait()
+        
+        timeout = max(0.1, 4 * self._conversion_time_s)
+        try:
+            for _ in range(skip):
+                await asyncio.wait_for(queue.get(), timeout)
+            return await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"No conversion-ready signal on GPIO{self.rdy_gpio}")
+    
+    async def start_conversion(self, channel: int):
+        """
+        Start a conversion on a channel without waiting for the result
+        
+        Pair with read_conversion(). Work done in between (such as switching and
+        settling the next multiplexer address) overlaps with the conversion time.
         
-        return self.channels[channel_num]
+        Args:
+            channel: ADC channel (0-3)
+        """
+        if not self.initialized:
+            raise RuntimeError("ADS1115 not initialized")
+        
+        if not 0 <= channel <= 3:
+            raise ValueError("Channel must be 0-3")
+        
+        # In continuous mode the chip is always converting; the channel is selected on read
+        if not self.continuous:
+            self.free_running = False
+            await self._run_io(self._write_config, self._config_words[channel])
+        
+        self._pending_channel = channel
+        self._pending_started = time.monotonic()
+    
+    async def read_conversion(self) -> float:
+        """
+        Read the result of the conversion started by start_conversion()
+        
+        Returns:
+            Voltage reading in volts
+        """
+        channel = self._pending_channel
+        if channel is None:
+            raise RuntimeError("No conversion started")
+        self._pending_channel = None
+        
+        try:
+            if self.continuous:
+                raw_value = await self._read_continuous(channel)
+            else:
+                raw_value = await self._await_conversion(channel, started=self._pending_started)
+            
+            return raw_value * self._v_per_bit
+            
+        except Exception as e:
+            logger.error(f"Failed to read ADS1115 conversion on channel {channel}: {e}")
+            raise
+    
+    async def start_continuous(self, channel: int = 0):
+        """
+        Start free-running continuous conversions on a channel
+        
+        Results are then fetched with read_last_conversion(), a single register
+        read each. Unlike the RDY-driven mode this needs no GPIO, so after any
+        change at the input the caller must wait two conversion periods before
+        the result reflects it.
+        
+        Args:
+            channel: ADC channel (0-3)
+        """
+        if not self.initialized:
+            raise RuntimeError("ADS1115 not initialized")
+        
+        if not 0 <= channel <= 3:
+            raise ValueError("Channel must be 0-3")
+        
+        if self.continuous:
+            raise RuntimeError("ADS1115 already in RDY-driven continuous mode")
+        
+        if self.free_running and channel == self._continuous_channel:
+            return
+        
+        await self._run_io(self._write_config, self._continuous_config_words[channel])
+        self._continuous_channel = channel
+        self.free_running = True
+    
+    async def read_last_conversion(self) -> float:
+        """
+        Read the most recent free-running conversion result
+        
+        Returns:
+            Voltage reading in volts
+        """
+        if not self.free_running:
+            raise RuntimeError("Continuous conversions not started")
+        
+        raw_value = await self._run_io(self._read_conversion)
+        return raw_value * self._v_per_bit
+    
+    async def stop_continuous(self):
+        """Stop free-running conversions and power the ADS1115 down"""
+        if not self.free_running:
+            return
+        
+        self.free_running = False
+        self._continuous_channel = None
+        
+        # Single-shot config without OS set powers the chip down
+        await self._run_io(self._write_config, self._config_words[0] & ~_CONFIG_OS_SINGLE)
     
     async def read_channel(self, channel: int) -> float:
         """
@@ -142,13 +603,15 @@ class ADS1115Service:
             raise ValueError("Channel must be 0-3")
         
         try:
-            # Get the channel instance
-            analog_channel = self._get_channel(channel)
+            if self.continuous:
+                raw_value = await self._read_continuous(channel)
+            else:
+                raw_value = await self._convert(channel)
             
-            # Read voltage (the library handles the conversion from raw ADC value)
-            voltage = analog_channel.voltage
+            voltage = raw_value * self._v_per_bit
             
-            logger.debug(f"Read channel {channel}: {voltage:.4f}V")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Read channel %d: %.4fV", channel, voltage)
             return voltage
             
         except Exception as e:
@@ -172,19 +635,44 @@ class ADS1115Service:
             raise ValueError("Channel must be 0-3")
         
         try:
-            # Get the channel instance  
-            analog_channel = self._get_channel(channel)
-            
-            # Read raw value
-            raw_value = analog_channel.value
+            if self.continuous:
+                raw_value = await self._read_continuous(channel)
+            else:
+                raw_value = await self._convert(channel)
             
-            logger.debug(f"Read raw channel {channel}: {raw_value}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Read raw channel %d: %d", channel, raw_value)
             return raw_value
             
         except Exception as e:
             logger.error(f"Failed to read raw ADS1115 channel {channel}: {e}")
             raise
     
+    async def _sweep(self) -> List[float]:
+        """
+        Read all 4 channels
+        
+        Returns:
+            Voltages for channels 0-3
+        """
+        volts_per_bit = self._v_per_bit
+        voltages = [0.0] * 4
+        
+        if self.continuous:
+            for channel in range(4):
+                voltages[channel] = await self._read_continuous(channel) * volts_per_bit
+        else:
+            # Each conversion read also triggers the next channel's conversion
+            config_words = self._config_words
+            self.free_running = False
+            await self._run_io(self._write_config, config_words[0])
+            for channel in range(4):
+                next_config = config_words[channel + 1] if channel < 3 else None
+                raw_value = await self._await_conversion(channel, next_config)
+                voltages[channel] = raw_value * volts_per_bit
+        
+        return voltages
+    
     async def read_all_channels(self) -> Dict[int, float]:
         """
         Read voltage from all 4 channels
@@ -195,17 +683,11 @@ class ADS1115Service:
         if not self.initialized:
             raise RuntimeError("ADS1115 not initialized")
         
-        results = {}
-        
         try:
-            for channel in range(4):
-                voltage = await self.read_channel(channel)
-                results[channel] = voltage
-                
-                # Small delay between readings to prevent I2C bus congestion
-                await asyncio.sleep(0.01)
+            results = dict(enumerate(await self._sweep()))
             
-            logger.debug(f"Read all channels: {results}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Read all channels: %s", results)
             return results
             
         except Exception as e:
@@ -233,11 +715,12 @@ class ADS1115Service:
             results['connection'] = await self.test_connection()
             
             if results['connection']:
-                # Test all channels
+                # Test all channels - one conversion each, voltage scaled from the raw value
+                volts_per_bit = self._v_per_bit
                 for channel in range(4):
                     try:
-                        voltage = await self.read_channel(channel)
                         raw_value = await self.read_raw_channel(channel)
+                        voltage = raw_value * volts_per_bit
                         
                         results['channels'][channel] = {
                             'voltage': voltage,
@@ -252,8 +735,8 @@ class ADS1115Service:
                         }
                         logger.error(f"Channel {channel} test failed: {e}")
                     
-                    # Small delay between channel tests
-                    await asyncio.sleep(0.05)
+                    # Let the next conversion period start before testing the next channel
+                    await asyncio.sleep(self._conversion_time_s + I2C_MARGIN_S)
                     
         except Exception as e:
             results['error'] = str(e)
@@ -272,7 +755,10 @@ class ADS1115Service:
             'initialized': self.initialized,
             'address': f"0x{self.address:02x}",
             'gain': self._gain_to_voltage_range(self.current_gain),
-            'active_channels': list(self.channels.keys())
+            'data_rate': self.data_rate,
+            'mode': ('continuous' if self.continuous else
+                     'free-running' if self.free_running else 'single-shot'),
+            'active_channels': [0, 1, 2, 3] if self.initialized else []
         }
     
     async def cleanup(self):
@@ -280,20 +766,25 @@ class ADS1115Service:
         try:
             if self.initialized:
                 logger.info("Cleaning up ADS1115 resources...")
-                
-                # Clear channel instances
-                self.channels.clear()
-                
-                # Deinitialize I2C bus
-                if self.i2c:
-                    try:
-                        self.i2c.deinit()
-                    except Exception as e:
-                        logger.warning(f"Error deinitializing I2C bus: {e}")
+            
+            # Stop the I/O thread first, letting an in-flight transfer finish so
+            # nothing touches the bus after it is closed
+            if self._io_executor:
+                self._io_executor.shutdown(wait=True, cancel_futures=True)
+                self._io_executor = None
+            
+            # Leave continuous mode and release pigpio
+            self._stop_continuous_mode()
+            
+            # Close the I2C bus handle, including one left by a failed initialize()
+            if self.i2c:
+                try:
+                    self.i2c.close()
+                except Exception as e:
+                    logger.warning(f"Error closing I2C bus: {e}")
+                self.i2c = None
             
             self.initialized = False
-            self.ads = None
-            self.i2c = None
             
             logger.info("ADS1115 cleanup complete")
             
@@ -7,7 +7,8 @@ Optimized for Raspberry Pi 1 Model B+ ARM6 architecture
 import os
 import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from .gpio_service import GPIOService
@@ -16,6 +17,9 @@ from .http_data_sender import HTTPDataSender
 
 logger = logging.getLogger(__name__)
 
+# Event loop timer wakeups can be late by a millisecond or two; the tail is spun
+PRECISE_SPIN_S = 0.002
+
 class FuseMonitorService:
     """Main service coordinating fuse monitoring system"""
     
@@ -36,6 +40,7 @@ class FuseMonitorService:
         
         # Monitoring configuration
         self.data_collection_interval = 5.0  # seconds
+        self.mux_settle_time = 0.1  # seconds after switching multiplexer channel
         self.current_mux = 0
         self.current_channel = 0
     
@@ -158,6 +163,9 @@ class FuseMonitorService:
         try:
             logger.info(f"Starting fuse monitoring every {self.data_collection_interval}s")
             
+            if not self.ads1115_service.continuous:
+                await self.ads1115_service.start_continuous(0)
+            
             self.monitoring = True
             self.monitor_task = asyncio.create_task(self._monitoring_loop())
             
@@ -186,9 +194,12 @@ class FuseMonitorService:
                     pass
                 self.monitor_task = None
             
+            if self.ads1115_service:
+                await self.ads1115_service.stop_continuous()
+            
             # Disable all multiplexers
             if self.gpio_service:
-                await self.gpio_service.disable_all_mux()
+                self.gpio_service.disable_all_mux()
             
             logger.info("Fuse monitoring stopped")
             
@@ -204,10 +215,11 @@ class FuseMonitorService:
                 start_time = asyncio.get_event_loop().time()
                 
                 # Collect data from all fuses
+                timestamp = self.http_sender.timestamp()
                 fuse_data = await self._collect_all_fuse_data()
                 
-                # Send data via HTTP
-                await self.http_sender.log_fuse_readings(fuse_data)
+                # Only queued here; the HTTP sender's own task does the network I/O
+                await self.http_sender.log_fuse_readings(fuse_data, timestamp)
                 
                 # Calculate actual collection time
                 collection_time = asyncio.get_event_loop().time() - start_time
@@ -229,28 +241,26 @@ class FuseMonitorService:
             self.monitoring = False
             raise
     
-    async def _collect_all_fuse_data(self) -> Dict[int, float]:
+    async def _collect_all_fuse_data(self) -> List[float]:
         """
         Collect voltage readings from all 64 fuses
         
         Returns:
-            Dictionary mapping fuse numbers to voltage readings
+            List of 64 voltage readings, index = fuse number - 1
         """
-        fuse_data = {}
+        fuse_data = [0.0] * self.total_fuses  # 0V for failed readings
         
         try:
-            # Iterate through all muxes and channels
-            for mux_index in range(self.total_muxes):
-                for channel in range(self.channels_per_mux):
-                    fuse_number = (mux_index * self.channels_per_mux) + channel + 1
-                    
+            if self.ads1115_service.continuous:
+                # RDY-driven conversions are awaited per read
+                for fuse_index in range(self.total_fuses):
                     try:
-                        voltage = await self._read_fuse(fuse_number)
-                        fuse_data[fuse_number] = voltage
+                        fuse_data[fuse_index] = await self._read_fuse(fuse_index + 1)
                         
                     except Exception as e:
-                        logger.error(f"Failed to read fuse {fuse_number}: {e}")
-                        fuse_data[fuse_number] = 0.0  # Use 0V for failed readings
+                        logger.error(f"Failed to read fuse {fuse_index + 1}: {e}")
+            else:
+                await self._collect_free_running(fuse_data)
             
             logger.debug(f"Collected data from {len(fuse_data)} fuses")
             return fuse_data
@@ -259,6 +269,73 @@ class FuseMonitorService:
             logger.error(f"Failed to collect fuse data: {e}")
             raise
     
+    async def _collect_free_running(self, fuse_data: List[float]):
+        """
+        Read all fuses from free-running ADS1115 conversions
+        
+        The ADC converts continuously on the active mux's AIN channel, so each
+        fuse costs a single conversion-register read once the mux has settled.
+        
+        Args:
+            fuse_data: List of 64 readings to fill, index = fuse number - 1
+        """
+        adc = self.ads1115_service
+        
+        for fuse_index in range(self.total_fuses):
+            fuse_number = fuse_index + 1
+            
+            try:
+                # MUX 0 -> AIN0, MUX 1 -> AIN1, MUX 2 -> AIN2, MUX 3 -> AIN3
+                await adc.start_continuous(fuse_index // self.channels_per_mux)
+                await self._select_fuse_settled(fuse_number)
+                
+                # The conversion in flight at the switch is mixed; the next one is clean
+                extra = 2 * adc.conversion_time - self.mux_settle_time
+                if extra > 0:
+                    await self._precise_delay(extra)
+                
+                fuse_data[fuse_index] = await adc.read_last_conversion()
+                
+            except Exception as e:
+                logger.error(f"Failed to read fuse {fuse_number}: {e}")
+    
+    async def _precise_delay(self, seconds: float):
+        """
+        Delay without the event loop timer's wakeup jitter
+        
+        Sleeps on the loop timer for all but the last PRECISE_SPIN_S, then spins
+        on the monotonic clock, yielding to the loop, until the deadline.
+        
+        Args:
+            seconds: Delay in seconds
+        """
+        deadline = time.monotonic() + seconds
+        
+        coarse = seconds - PRECISE_SPIN_S
+        if coarse > 0:
+            await asyncio.sleep(coarse)
+        
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0)
+    
+    async def _select_fuse_settled(self, fuse_number: int):
+        """
+        Select a fuse and wait for the multiplexer output to settle
+        
+        Args:
+            fuse_number: Fuse number (1-64)
+        """
+        # Within a mux only the address bits change; the enable pins are left alone
+        await self.gpio_service.select_fuse(fuse_number)
+        
+        # Small settling delay for multiplexer switching
+        await self._precise_delay(self.mux_settle_time)
+        
+        # Update tracking variables
+        fuse_index = fuse_number - 1
+        self.current_mux = fuse_index // self.channels_per_mux
+        self.current_channel = fuse_index % self.channels_per_mux
+    
     async def _read_fuse(self, fuse_number: int) -> float:
         """
         Read voltage from a specific fuse
@@ -273,26 +350,15 @@ class FuseMonitorService:
             raise ValueError(f"Fuse number must be 1-{self.total_fuses}")
         
         try:
-            # Calculate which mux and channel this fuse corresponds to
-            fuse_index = fuse_number - 1
-            mux_index = fuse_index // self.channels_per_mux  # 0-3 for MUX0-MUX3
-            channel = fuse_index % self.channels_per_mux    # 0-15 for channels
+            # Calculate which mux this fuse corresponds to (0-3 for MUX0-MUX3)
+            mux_index = (fuse_number - 1) // self.channels_per_mux
             
             # Select the appropriate multiplexer and channel
-            await self.gpio_service.select_fuse(fuse_number)
-            
-            # Small settling delay for multiplexer switching
-            await asyncio.sleep(0.1)
+            await self._select_fuse_settled(fuse_number)
             
             # Read from the appropriate ADC channel based on MUX
             # MUX 0 -> AIN0, MUX 1 -> AIN1, MUX 2 -> AIN2, MUX 3 -> AIN3
-            voltage = await self.ads1115_service.read_channel(mux_index)
-            
-            # Update tracking variables
-            self.current_mux = mux_index
-            self.current_channel = channel
-            
-            return voltage
+            return await self.ads1115_service.read_channel(mux_index)
             
         except Exception as e:
             logger.error(f"Failed to read fuse {fuse_number}: {e}")
@@ -1,13 +1,27 @@
 """
 GPIO Service for Multiplexer Control
-Handles GPIO operations for CD74HC4067M multiplexers using RPi.GPIO
+Handles GPIO operations for CD74HC4067M multiplexers using lgpio (or RPi.GPIO
+when lgpio is not installed), with level writes through /dev/gpiomem when available
 Optimized for Raspberry Pi 1 Model B+ ARM6 architecture
 """
 
 import asyncio
 import logging
+import mmap
+import os
 from typing import Dict, Any, Optional
-import RPi.GPIO as GPIO
+
+from .realtime import settle_ns, try_realtime
+
+try:
+    import lgpio
+except ImportError:
+    lgpio = None
+
+try:
+    import RPi.GPIO as GPIO
+except (ImportError, RuntimeError):  # RuntimeError: not running on a Pi
+    GPIO = None
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +40,45 @@ MUX_ENABLE_PINS = {
     'MUX3': 13,  # Pi Pin 33 (GPIO13)
 }
 
+# BCM2835 GPIO register block, mapped through /dev/gpiomem (no root needed)
+GPIOMEM_PATH = '/dev/gpiomem'
+GPIOMEM_SIZE = 4096
+_GPSET0 = 0x1C // 4  # Word index: writing 1 bits drives pins 0-31 high
+_GPCLR0 = 0x28 // 4  # Word index: writing 1 bits drives pins 0-31 low
+
+_S_PINS = tuple(MUX_CONTROL_PINS[name] for name in ('S0', 'S1', 'S2', 'S3'))
+_CONTROL_MASK = sum(1 << pin for pin in _S_PINS)
+
+def _channel_set_mask(channel: int) -> int:
+    """GPSET0 bits for the S0-S3 pattern of a channel (hardware channel = 15 - channel)"""
+    inverted_channel = 15 - channel
+    return sum(1 << pin for bit, pin in enumerate(_S_PINS) if (inverted_channel >> bit) & 1)
+
+# Per-channel (0-15) S0-S3 register masks, and the same pattern as RPi.GPIO levels
+_CHANNEL_SET_MASK = tuple(_channel_set_mask(channel) for channel in range(16))
+_CHANNEL_CLR_MASK = tuple(_CONTROL_MASK & ~mask for mask in _CHANNEL_SET_MASK)
+_CHANNEL_LEVELS = tuple(tuple((mask >> pin) & 1 for pin in _S_PINS) for mask in _CHANNEL_SET_MASK)
+# lgpio group bits: bit i drives _S_PINS[i]
+_CHANNEL_GROUP_BITS = tuple(sum(level << bit for bit, level in enumerate(levels))
+                            for levels in _CHANNEL_LEVELS)
+
+# CD74HC4067 switching settle times (datasheet t_trans / t_en are a few hundred ns)
+CHANNEL_SETTLE_NS = 500
+ENABLE_SETTLE_NS = 1000
+
+# Per-fuse (index = fuse number - 1) multiplexer and channel
+_FUSE_TO_MUX = tuple(fuse_index // 16 for fuse_index in range(64))
+_FUSE_TO_CHANNEL = tuple(fuse_index % 16 for fuse_index in range(64))
+
+# Per-mux (0-3) enable register masks, active low: clear the selected pin, set the others
+_ENABLE_PINS = tuple(MUX_ENABLE_PINS[f'MUX{index}'] for index in range(4))
+_ENABLE_MASK = sum(1 << pin for pin in _ENABLE_PINS)  # All enables high: every mux disabled
+_ENABLE_CLR_MASK = tuple(1 << pin for pin in _ENABLE_PINS)
+_ENABLE_SET_MASK = tuple(_ENABLE_MASK & ~mask for mask in _ENABLE_CLR_MASK)
+# lgpio group bits: bit i drives _ENABLE_PINS[i]
+_ENABLE_GROUP_ALL = 0b1111
+_ENABLE_GROUP_BITS = tuple(_ENABLE_GROUP_ALL & ~(1 << index) for index in range(4))
+
 class GPIOService:
     """GPIO service for controlling CD74HC4067M multiplexers"""
     
@@ -33,6 +86,14 @@ class GPIOService:
         self.initialized = False
         self.current_mux: Optional[int] = None
         self.current_channel: Optional[int] = None
+        
+        # Pin setup backend: an lgpio chip handle, or RPi.GPIO when _lgpio_handle is None
+        self._lgpio_handle: Optional[int] = None
+        self._rpi_gpio = False
+        
+        # Direct register access for level writes; None uses the setup backend
+        self._gpiomem: Optional[mmap.mmap] = None
+        self._gpio_regs: Optional[memoryview] = None
     
     async def initialize(self):
         """Initialize GPIO pins for multiplexer control"""
@@ -43,36 +104,183 @@ class GPIOService:
         try:
             logger.info("Initializing GPIO service...")
             
-            # Set GPIO mode to BCM (Broadcom pin numbering)
-            GPIO.setmode(GPIO.BCM)
+            # Pin writes and settle busy-waits are timing sensitive
+            try_realtime()
             
-            # Disable GPIO warnings (common on Pi systems)
-            GPIO.setwarnings(False)
+            # Claim the lines as outputs through lgpio, or RPi.GPIO without it
+            if not self._open_lgpio():
+                self._setup_rpi_gpio()
             
-            # Initialize control pins (S0, S1, S2, S3) as outputs
-            for pin_name, pin_number in MUX_CONTROL_PINS.items():
-                GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.LOW)
-                logger.debug(f"Initialized control pin {pin_name} (GPIO{pin_number}) as output")
-            
-            # Initialize enable pins as outputs (active low, so start high = disabled)
-            for mux_name, pin_number in MUX_ENABLE_PINS.items():
-                GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.HIGH)
-                logger.debug(f"Initialized enable pin {mux_name} (GPIO{pin_number}) as output (disabled)")
+            # Level writes go straight to the registers when they can be mapped
+            self._open_gpiomem()
             
             # Ensure all multiplexers start disabled
-            await self.disable_all_mux()
+            self.disable_all_mux()
             
             self.initialized = True
             logger.info("GPIO service initialized successfully")
             logger.info(f"Control pins: {MUX_CONTROL_PINS}")
             logger.info(f"Enable pins: {MUX_ENABLE_PINS}")
+            logger.info(f"Pin writes: {self._pin_access()}")
             
         except Exception as e:
             logger.error(f"Failed to initialize GPIO service: {e}")
             await self.cleanup()
             raise
     
-    async def set_mux_channel(self, channel: int):
+    def _open_gpiomem(self):
+        """Map the GPIO registers so each pin update is a single store instead of a syscall"""
+        try:
+            fd = os.open(GPIOMEM_PATH, os.O_RDWR | os.O_SYNC)
+        except OSError as e:
+            logger.warning(f"Cannot open {GPIOMEM_PATH}, using {self._setup_backend()} for pin writes: {e}")
+            return
+        
+        try:
+            self._gpiomem = mmap.mmap(fd, GPIOMEM_SIZE, mmap.MAP_SHARED,
+                                      mmap.PROT_READ | mmap.PROT_WRITE)
+            # 32-bit view: peripheral registers must be written as whole words
+            self._gpio_regs = memoryview(self._gpiomem).cast('I')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cannot map {GPIOMEM_PATH}, using {self._setup_backend()} for pin writes: {e}")
+            self._close_gpiomem()
+        finally:
+            os.close(fd)
+    
+    def _close_gpiomem(self):
+        """Release the GPIO register mapping"""
+        if self._gpio_regs is not None:
+            self._gpio_regs.release()
+            self._gpio_regs = None
+        
+        if self._gpiomem is not None:
+            self._gpiomem.close()
+            self._gpiomem = None
+    
+    def _open_lgpio(self) -> bool:
+        """
+        Claim S0-S3 and the enables as lgpio groups so each update is one C call
+        
+        Returns:
+            True if the lines were claimed
+        """
+        if lgpio is None:
+            logger.info("lgpio not available, using RPi.GPIO")
+            return False
+        
+        handle = None
+        try:
+            handle = lgpio.gpiochip_open(0)
+            # Channel lines start low, enables high (active low = all muxes disabled)
+            lgpio.group_claim_output(handle, list(_S_PINS), [0] * len(_S_PINS))
+            lgpio.group_claim_output(handle, list(_ENABLE_PINS), [1] * len(_ENABLE_PINS))
+            self._lgpio_handle = handle
+            logger.debug(f"Claimed control pins {_S_PINS} and enable pins {_ENABLE_PINS} via lgpio")
+            return True
+        except Exception as e:
+            if handle is not None:
+                lgpio.gpiochip_close(handle)
+            if GPIO is None:
+                raise RuntimeError(f"Cannot claim GPIO lines through lgpio: {e}") from e
+            logger.warning(f"Cannot claim GPIO lines through lgpio, using RPi.GPIO: {e}")
+            return False
+    
+    def _setup_rpi_gpio(self):
+        """Set up the control and enable pins as outputs with RPi.GPIO"""
+        if GPIO is None:
+            raise RuntimeError("Neither lgpio nor RPi.GPIO is available")
+        
+        # Set GPIO mode to BCM (Broadcom pin numbering)
+        GPIO.setmode(GPIO.BCM)
+        
+        # Disable GPIO warnings (common on Pi systems)
+        GPIO.setwarnings(False)
+        self._rpi_gpio = True
+        
+        # Initialize control pins (S0, S1, S2, S3) as outputs
+        for pin_name, pin_number in MUX_CONTROL_PINS.items():
+            GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.LOW)
+            logger.debug(f"Initialized control pin {pin_name} (GPIO{pin_number}) as output")
+        
+        # Initialize enable pins as outputs (active low, so start high = disabled)
+        for mux_name, pin_number in MUX_ENABLE_PINS.items():
+            GPIO.setup(pin_number, GPIO.OUT, initial=GPIO.HIGH)
+            logger.debug(f"Initialized enable pin {mux_name} (GPIO{pin_number}) as output (disabled)")
+    
+    def _close_lgpio(self):
+        """Release the lgpio chip handle (and with it the claimed lines)"""
+        if self._lgpio_handle is not None:
+            try:
+                lgpio.gpiochip_close(self._lgpio_handle)
+            except Exception as e:
+                logger.warning(f"Error closing lgpio chip: {e}")
+            self._lgpio_handle = None
+    
+    def _setup_backend(self) -> str:
+        """Name of the library that owns the pins"""
+        return 'lgpio' if self._lgpio_handle is not None else 'RPi.GPIO'
+    
+    def _pin_access(self) -> str:
+        """Name of the backend used for level writes"""
+        if self._gpio_regs is not None:
+            return 'gpiomem'
+        return self._setup_backend()
+    
+    def _write_pin(self, pin: int, level: int):
+        """Drive a single pin (uncached path for tests and cleanup)"""
+        if self._lgpio_handle is not None:
+            lgpio.gpio_write(self._lgpio_handle, pin, level)
+        else:
+            GPIO.output(pin, level)
+    
+    def _write_channel(self, channel: int):
+        """Drive S0-S3 for a channel (0-15) without settling"""
+        # Channel mapping is inverted (0->15, 1->14, ..., 15->0), baked into the tables
+        regs = self._gpio_regs
+        if regs is not None:
+            # Two stores: between GPSET0 and GPCLR0, S0-S3 briefly read old|new, so an
+            # intermediate channel is selected for a few bus cycles; the settle delay
+            # that follows every switch covers it
+            regs[_GPSET0] = _CHANNEL_SET_MASK[channel]
+            regs[_GPCLR0] = _CHANNEL_CLR_MASK[channel]
+        elif self._lgpio_handle is not None:
+            lgpio.group_write(self._lgpio_handle, _S_PINS[0], _CHANNEL_GROUP_BITS[channel])
+        else:
+            GPIO.output(_S_PINS, _CHANNEL_LEVELS[channel])
+        
+        self.current_channel = channel  # Store the requested channel, not the inverted one
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Set multiplexer channel %d -> hardware channel %d", channel, 15 - channel)
+    
+    def _write_enable(self, mux_index: int) -> bool:
+        """
+        Enable a multiplexer (0-3) without settling, touching only the pins that change
+        
+        Returns:
+            True if the enabled multiplexer changed
+        """
+        previous = self.current_mux
+        if previous == mux_index:
+            return False
+        
+        regs = self._gpio_regs
+        if regs is not None:
+            # Disable the others before enabling the target (active low)
+            regs[_GPSET0] = _ENABLE_SET_MASK[mux_index]
+            regs[_GPCLR0] = _ENABLE_CLR_MASK[mux_index]
+        elif self._lgpio_handle is not None:
+            lgpio.group_write(self._lgpio_handle, _ENABLE_PINS[0], _ENABLE_GROUP_BITS[mux_index])
+        else:
+            if previous is not None:
+                GPIO.output(_ENABLE_PINS[previous], GPIO.HIGH)
+            GPIO.output(_ENABLE_PINS[mux_index], GPIO.LOW)
+        
+        self.current_mux = mux_index
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Enabled multiplexer %d (MUX%d)", mux_index, mux_index)
+        return True
+    
+    def set_mux_channel(self, channel: int):
         """
         Set multiplexer channel (0-15)
         
@@ -86,26 +294,16 @@ class GPIOService:
             raise ValueError("Channel must be 0-15")
         
         try:
-            # Invert channel mapping: 0->15, 1->14, 2->13, ..., 15->0
-            inverted_channel = 15 - channel
-            
-            # Convert inverted channel to binary and set S0, S1, S2, S3 pins
-            GPIO.output(MUX_CONTROL_PINS['S0'], inverted_channel & 0x01)
-            GPIO.output(MUX_CONTROL_PINS['S1'], (inverted_channel & 0x02) >> 1)
-            GPIO.output(MUX_CONTROL_PINS['S2'], (inverted_channel & 0x04) >> 2)
-            GPIO.output(MUX_CONTROL_PINS['S3'], (inverted_channel & 0x08) >> 3)
-            
-            self.current_channel = channel  # Store the requested channel, not the inverted one
-            logger.debug(f"Set multiplexer channel {channel} -> hardware channel {inverted_channel}")
+            self._write_channel(channel)
             
             # Small settling delay for multiplexer switching
-            await asyncio.sleep(0.001)
+            settle_ns(CHANNEL_SETTLE_NS)
             
         except Exception as e:
             logger.error(f"Failed to set multiplexer channel {channel}: {e}")
             raise
     
-    async def enable_mux(self, mux_index: int):
+    def enable_mux(self, mux_index: int):
         """
         Enable a specific multiplexer (disable others)
         
@@ -119,33 +317,28 @@ class GPIOService:
             raise ValueError("Multiplexer index must be 0-3")
         
         try:
-            # First disable all multiplexers
-            await self.disable_all_mux()
-            
-            # Enable the specified multiplexer (active low)
-            mux_names = ['MUX0', 'MUX1', 'MUX2', 'MUX3']
-            mux_name = mux_names[mux_index]
-            GPIO.output(MUX_ENABLE_PINS[mux_name], GPIO.LOW)
-            
-            self.current_mux = mux_index
-            logger.debug(f"Enabled multiplexer {mux_index} ({mux_name})")
-            
-            # Small settling delay for multiplexer enabling
-            await asyncio.sleep(0.002)
+            if self._write_enable(mux_index):
+                # Small settling delay for multiplexer enabling
+                settle_ns(ENABLE_SETTLE_NS)
             
         except Exception as e:
             logger.error(f"Failed to enable multiplexer {mux_index}: {e}")
             raise
     
-    async def disable_all_mux(self):
+    def disable_all_mux(self):
         """Disable all multiplexers"""
         if not self.initialized:
             return
         
         try:
             # Set all enable pins high (disabled)
-            for pin_number in MUX_ENABLE_PINS.values():
-                GPIO.output(pin_number, GPIO.HIGH)
+            regs = self._gpio_regs
+            if regs is not None:
+                regs[_GPSET0] = _ENABLE_MASK
+            elif self._lgpio_handle is not None:
+                lgpio.group_write(self._lgpio_handle, _ENABLE_PINS[0], _ENABLE_GROUP_ALL)
+            else:
+                GPIO.output(_ENABLE_PINS, GPIO.HIGH)
             
             self.current_mux = None
             logger.debug("All multiplexers disabled")
@@ -161,24 +354,27 @@ class GPIOService:
         Args:
             fuse_number: Fuse number (1-64)
         """
+        if not self.initialized:
+            raise RuntimeError("GPIO service not initialized")
+        
         if not 1 <= fuse_number <= 64:
             raise ValueError("Fuse number must be 1-64")
         
         # Convert fuse number to mux and channel (0-based internally)
-        fuse_index = fuse_number - 1  # Convert to 0-based
-        mux_index = fuse_index // 16   # 16 channels per mux
-        channel = fuse_index % 16      # Channel within mux
+        fuse_index = fuse_number - 1
+        mux_index = _FUSE_TO_MUX[fuse_index]
+        channel = _FUSE_TO_CHANNEL[fuse_index]
         
-        logger.debug(f"Selecting fuse {fuse_number}: mux={mux_index}, channel={channel}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Selecting fuse %d: mux=%d, channel=%d", fuse_number, mux_index, channel)
         
         try:
-            # Set the channel first
-            await self.set_mux_channel(channel)
-            
-            # Enable the appropriate multiplexer
-            await self.enable_mux(mux_index)
+            # Set the channel first, then enable the appropriate multiplexer
+            self._write_channel(channel)
+            self._write_enable(mux_index)
             
-            logger.debug(f"Selected fuse {fuse_number} successfully")
+            # One settling delay covers both channel switching and enabling
+            settle_ns(ENABLE_SETTLE_NS)
             
         except Exception as e:
             logger.error(f"Failed to select fuse {fuse_number}: {e}")
@@ -201,9 +397,9 @@ class GPIOService:
             for pin_name, pin_number in MUX_CONTROL_PINS.items():
                 try:
                     # Test by setting high then low
-                    GPIO.output(pin_number, GPIO.HIGH)
+                    self._write_pin(pin_number, 1)
                     await asyncio.sleep(0.001)
-                    GPIO.output(pin_number, GPIO.LOW)
+                    self._write_pin(pin_number, 0)
                     results[f"control_{pin_name}"] = True
                 except Exception as e:
                     logger.error(f"Control pin {pin_name} test failed: {e}")
@@ -213,18 +409,18 @@ class GPIOService:
             for mux_name, pin_number in MUX_ENABLE_PINS.items():
                 try:
                     # Test by setting low then high (active low)
-                    GPIO.output(pin_number, GPIO.LOW)
+                    self._write_pin(pin_number, 0)
                     await asyncio.sleep(0.001)
-                    GPIO.output(pin_number, GPIO.HIGH)
+                    self._write_pin(pin_number, 1)
                     results[f"enable_{mux_name}"] = True
                 except Exception as e:
                     logger.error(f"Enable pin {mux_name} test failed: {e}")
                     results[f"enable_{mux_name}"] = False
             
             # Reset all pins to default state
-            await self.disable_all_mux()
+            self.disable_all_mux()
             for pin_number in MUX_CONTROL_PINS.values():
-                GPIO.output(pin_number, GPIO.LOW)
+                self._write_pin(pin_number, 0)
                 
         except Exception as e:
             logger.error(f"GPIO pin test failed: {e}")
@@ -243,7 +439,8 @@ class GPIOService:
             'current_mux': self.current_mux,
             'current_channel': self.current_channel,
             'control_pins': MUX_CONTROL_PINS,
-            'enable_pins': MUX_ENABLE_PINS
+            'enable_pins': MUX_ENABLE_PINS,
+            'pin_access': self._pin_access()
         }
     
     async def cleanup(self):
@@ -253,17 +450,22 @@ class GPIOService:
                 logger.info("Cleaning up GPIO resources...")
                 
                 # Disable all multiplexers
-                await self.disable_all_mux()
+                self.disable_all_mux()
                 
                 # Reset control pins to low
                 for pin_number in MUX_CONTROL_PINS.values():
                     try:
-                        GPIO.output(pin_number, GPIO.LOW)
+                        self._write_pin(pin_number, 0)
                     except Exception as e:
                         logger.warning(f"Error resetting GPIO{pin_number}: {e}")
             
+            self._close_gpiomem()
+            self._close_lgpio()
+            
             # Clean up all GPIO
-            GPIO.cleanup()
+            if self._rpi_gpio:
+                GPIO.cleanup()
+                self._rpi_gpio = False
             
             self.initialized = False
             self.current_mux = None
@@ -7,29 +7,101 @@ Includes fallback logic for offline operation on Pi 1 B+
 import asyncio
 import logging
 import json
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from collections import deque
-import requests
+import aiohttp
+import psutil
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to a JSON request body, with orjson when installed"""
+    if orjson is not None:
+        # readings are keyed by int fuse number; stdlib json stringifies those too
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+def _loads(line: bytes) -> Dict[str, Any]:
+    """Parse one JSON line written by _dumps()"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+# Fuse layout of a 64-reading sweep (fuse numbers, 1-based)
+TOTAL_FUSES = 64
+GROUND_FUSE = 1   # MUX 0, Channel 15->0 inverted - ground connection, not reported
+BATTERY_FUSE = 2  # MUX 0, Channel 14->1 inverted - battery voltage
+READING_FUSES = tuple(range(BATTERY_FUSE + 1, TOTAL_FUSES + 1))
+
+# SoC temperature in millidegrees Celsius
+CPU_TEMP_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# Seconds between background refreshes of the system info sent with each payload
+SYS_INFO_INTERVAL = 30.0
+
+# Upper bound on the retry backoff during a server outage (seconds)
+BACKOFF_MAX_S = 300
+
+# Append-only JSON-lines copy of the offline buffer, replayed at startup
+DEFAULT_BUFFER_FILE = './data/http_buffer.jsonl'
+
+# Statuses meaning the server rejected the payload itself; resending it can never succeed
+REJECTED_STATUSES = frozenset({400, 415, 422})
+
+# Buffered payloads per batch POST (~2KB each, keeps request bodies around 100KB)
+BATCH_MAX_PAYLOADS = 50
+
 class HTTPDataSender:
     """HTTP data transmission service with offline fallback"""
     
     def __init__(self):
         self.initialized = False
         self.server_url: Optional[str] = None
+        self.device_id = 'fusetester-001'
+        self._health_url: Optional[str] = None
+        self._batch_url: Optional[str] = None
+        
+        # Kept open; sysfs attributes regenerate their contents on every read from offset 0
+        self._temp_file = None
+        
+        # System info sampled in the background and attached to each payload as-is
+        self._sys_info: Dict[str, Any] = {}
+        self._sys_info_task: Optional[asyncio.Task] = None
+        
         self.api_key: Optional[str] = None
         self.timeout = 10  # seconds
         self.max_buffer_size = 100  # readings to keep in memory
         self.buffer = deque(maxlen=self.max_buffer_size)
         self.consecutive_failures = 0
         self.max_failures_before_buffer = 3
-        self.send_lock = asyncio.Lock()
+        self._backoff_until = 0.0  # time.monotonic() before which sends are skipped
+        self._batch_rejected = False  # Last batch POST was refused as a whole (REJECTED_STATUSES)
         self.last_successful_send = None
         
+        # Buffer persistence: raw O_APPEND fd and the number of lines in the file
+        self._wal_fd: Optional[int] = None
+        self._wal_path: Optional[str] = None
+        self._wal_entries = 0
+        
+        # One pooled connection reused across sends (HTTP keep-alive)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Payloads waiting for the sender task; log_fuse_readings() only enqueues
+        self._queue: Optional[asyncio.Queue] = None
+        self._sender_task: Optional[asyncio.Task] = None
+        
+        # Per-second cache of the formatted date/time part of payload timestamps
+        self._ts_second = -1
+        self._ts_prefix = ''
+        
     async def initialize(self, options: Dict[str, Any] = None):
         """
         Initialize HTTP data sender
@@ -47,15 +119,44 @@ class HTTPDataSender:
             self.api_key = os.getenv('API_KEY')
             self.timeout = int(os.getenv('HTTP_TIMEOUT', 10))
             self.max_buffer_size = int(os.getenv('MAX_BUFFER_SIZE', 100))
+            self.device_id = os.getenv('DEVICE_ID', self.device_id)
+            
+            # Resize the buffer to the configured capacity and restore readings from disk
+            self.buffer = deque(self.buffer, maxlen=self.max_buffer_size)
+            self._open_wal(os.getenv('BUFFER_FILE_PATH', DEFAULT_BUFFER_FILE))
+            
+            try:
+                self._temp_file = open(CPU_TEMP_PATH, 'rb', buffering=0)
+            except OSError:
+                self._temp_file = None
+            
+            self._sample_system_info()
+            self._sys_info_task = asyncio.create_task(self._sys_info_loop())
+            
+            # Started before any check that can fail so buffer-only mode still drains the queue
+            self._queue = asyncio.Queue()
+            self._start_sender()
             
             if not self.server_url:
                 raise ValueError("SERVER_URL environment variable is required")
             
+            # Health check and batch endpoints live next to the data endpoint
+            base_url = self.server_url.rstrip('/')
+            self._health_url = f"{base_url}/health"
+            # Cleared by _send_data() if the server has no batch endpoint (404/405)
+            self._batch_url = f"{base_url}/batch"
+            
             logger.info(f"Initializing HTTP Data Sender...")
             logger.info(f"Server URL: {self.server_url}")
             logger.info(f"Timeout: {self.timeout}s")
             logger.info(f"Buffer size: {self.max_buffer_size} readings")
             
+            self._session = aiohttp.ClientSession(
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=1, keepalive_timeout=60)
+            )
+            
             # Test connection
             await self._test_connection()
             
@@ -71,23 +172,14 @@ class HTTPDataSender:
     async def _test_connection(self):
         """Test connection to server"""
         try:
-            headers = self._get_headers()
-            
-            # Simple health check or ping endpoint
-            test_url = f"{self.server_url.rstrip('/')}/health"
+            async with self._session.get(self._health_url) as response:
+                status = response.status
             
-            # Use requests in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(test_url, headers=headers, timeout=self.timeout)
-            )
-            
-            if response.status_code < 400:
+            if status < 400:
                 logger.info("✓ Server connection test successful")
                 return True
             else:
-                logger.warning(f"Server returned status {response.status_code}")
+                logger.warning(f"Server returned status {status}")
                 return False
                 
         except Exception as e:
@@ -106,119 +198,338 @@ class HTTPDataSender:
         
         return headers
     
-    async def log_fuse_readings(self, fuse_data: Dict[int, float]):
+    def timestamp(self) -> str:
+        """
+        Get the current local time as an ISO 8601 string with microseconds
+        
+        Same format as datetime.now().isoformat(), but the date/time part is
+        only reformatted when the second changes.
+        """
+        now_us = time.time_ns() // 1000
+        second, micros = divmod(now_us, 1_000_000)
+        
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        
+        return '%s.%06d' % (self._ts_prefix, micros)
+    
+    async def log_fuse_readings(self, fuse_data: List[float], timestamp: Optional[str] = None):
         """
-        Send fuse readings to server with fallback logic
+        Queue fuse readings for the sender task and return without waiting on the network
+        
+        When the queue grows past max_buffer_size (the sender is stuck on a slow
+        server) the oldest queued payload is dropped.
         
         Args:
-            fuse_data: Dictionary mapping fuse numbers to voltage readings
+            fuse_data: List of 64 voltage readings, index = fuse number - 1
+            timestamp: ISO 8601 time the readings were taken (default: now)
         """
-        if not self.initialized:
+        if not self.initialized or self._queue is None:
             raise RuntimeError("HTTP Data Sender not initialized")
         
-        # Process fuse data to separate battery and exclude ground
-        processed_readings = {}
-        battery_voltage = None
-        
-        for fuse_num, voltage in fuse_data.items():
-            if fuse_num == 1:
-                # Fuse 1 (MUX 0, Channel 15->0 inverted) is ground connection - skip
-                logger.debug(f"Skipping ground connection: Fuse {fuse_num} = {voltage:.4f}V")
-                continue
-            elif fuse_num == 2:
-                # Fuse 1 (MUX 0, Channel 14->1 inverted) is battery voltage
-                battery_voltage = voltage
-                logger.debug(f"Battery voltage: {voltage:.4f}V")
-                continue
-            else:
-                # Regular fuse reading
-                processed_readings[fuse_num] = voltage
+        # Separate battery and exclude ground
+        battery_voltage = fuse_data[BATTERY_FUSE - 1]
+        
+        # Regular fuse readings
+        processed_readings = dict(zip(READING_FUSES, fuse_data[BATTERY_FUSE:]))
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skipping ground connection: Fuse %d = %.4fV",
+                         GROUND_FUSE, fuse_data[GROUND_FUSE - 1])
+            logger.debug("Battery voltage: %.4fV", battery_voltage)
         
         # Create data payload
         payload = {
-            'timestamp': datetime.now().isoformat(),
-            'device_id': os.getenv('DEVICE_ID', 'fusetester-001'),
+            'timestamp': timestamp or self.timestamp(),
+            'device_id': self.device_id,
             'readings': processed_readings,
             'battery': battery_voltage,
-            'system_info': await self._get_system_info()
+            'system_info': self._sys_info
         }
         
-        async with self.send_lock:
+        if self._queue.qsize() >= self.max_buffer_size:
+            dropped = self._queue.get_nowait()
+            logger.warning(f"Send queue full, dropping reading from {dropped['timestamp']}")
+        self._queue.put_nowait(payload)
+    
+    def _start_sender(self):
+        """Start the sender task, restarted by _on_sender_done() if it ever dies"""
+        self._sender_task = asyncio.create_task(self._sender_loop())
+        self._sender_task.add_done_callback(self._on_sender_done)
+    
+    def _on_sender_done(self, task: asyncio.Task):
+        """Log and restart a sender task that stopped on an unexpected exception"""
+        if task.cancelled() or task is not self._sender_task:
+            return
+        
+        exc = task.exception()
+        if exc is not None and self._queue is not None:
+            logger.error(f"HTTP sender task died, restarting: {exc!r}")
+            self._start_sender()
+    
+    async def _sender_loop(self):
+        """Send queued payloads until the None sentinel, batching whatever has piled up"""
+        while True:
+            payload = await self._queue.get()
+            if payload is None:
+                break
+            
+            batch = [payload]
+            stop = False
+            while len(batch) < BATCH_MAX_PAYLOADS and not self._queue.empty():
+                payload = self._queue.get_nowait()
+                if payload is None:
+                    stop = True
+                    break
+                batch.append(payload)
+            
+            delivered = False
             try:
-                # Try to send current data
-                success = await self._send_data(payload)
-                
-                if success:
-                    self.consecutive_failures = 0
-                    self.last_successful_send = datetime.now()
-                    
-                    # Try to send any buffered data
-                    await self._send_buffered_data()
-                    
-                    fuse_count = len(processed_readings)
-                    battery_info = f", battery: {battery_voltage:.4f}V" if battery_voltage is not None else ""
-                    logger.debug(f"Successfully sent data ({fuse_count} fuse readings{battery_info})")
-                else:
-                    # Add to buffer for retry
-                    await self._buffer_data(payload)
-                    
+                delivered = await self._send_queued(batch)
+            except asyncio.CancelledError:
+                # Keep the in-flight readings for the next run
+                await self._buffer_batch(batch)
+                raise
             except Exception as e:
                 logger.error(f"Failed to send fuse data: {e}")
-                await self._buffer_data(payload)
+                await self._buffer_batch(batch)
+            
+            if delivered:
+                # Server is reachable again; batch is already delivered, so never re-buffer it
+                try:
+                    await self._send_buffered_data()
+                except Exception as e:
+                    logger.error(f"Failed to send buffered data: {e}")
+            
+            if stop:
+                break
+    
+    async def _send_queued(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Send payloads taken from the queue, buffering them if the send fails
+        
+        Args:
+            batch: Payloads in the order they were queued
+            
+        Returns:
+            True if the payloads were delivered
+        """
+        sent = await self._send_many(batch)
+        
+        if sent:
+            self.consecutive_failures = 0
+            self.last_successful_send = datetime.now()
+            logger.debug(f"Successfully sent {sent} queued reading(s)")
+        
+        if sent < len(batch):
+            # Add the rest to the buffer for retry
+            await self._buffer_batch(batch[sent:])
+            return False
+        return True
+    
+    async def _send_many(self, batch: List[Dict[str, Any]]) -> int:
+        """
+        Send payloads in one batch POST, or one by one if the server has no batch endpoint
+        
+        Args:
+            batch: Payloads, oldest first
+            
+        Returns:
+            Number of payloads delivered, counted from the start of batch
+        """
+        if len(batch) > 1 and self._batch_url:
+            if await self._send_data({'batch': batch}, self._batch_url):
+                return len(batch)
+            if self._batch_url and not self._batch_rejected:
+                return 0
+            # Batch endpoint is missing, or refused the batch as a whole: send one by
+            # one so only the invalid payloads are dropped
+        
+        for sent, payload in enumerate(batch):
+            if not await self._send_data(payload):
+                return sent
+        return len(batch)
     
-    async def _send_data(self, payload: Dict[str, Any]) -> bool:
+    async def _send_data(self, payload: Dict[str, Any], url: Optional[str] = None) -> bool:
         """
         Send single data payload to server
         
+        Args:
+            payload: JSON body
+            url: Endpoint to post to (default: SERVER_URL)
+            
         Returns:
-            True if successful, False otherwise
+            True if successful, or if the server rejected a single payload as
+            invalid (it is logged and dropped); False otherwise
         """
+        self._batch_rejected = False
         try:
-            if not self.server_url:
+            if not self.server_url or not self._session:
                 return False
             
-            # Log the payload being sent
-            logger.info(f"Sending HTTP payload to {self.server_url}")
-            logger.info(f"Payload: {json.dumps(payload, indent=2)}")
-            
-            headers = self._get_headers()
-            
-            # Use requests in thread pool
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(
-                    self.server_url,
-                    json=payload,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-            )
+            # Server has been failing - buffer without waiting on another timeout
+            if time.monotonic() < self._backoff_until:
+                return False
+            
+            url = url or self.server_url
+            body = _dumps(payload)
+            
+            count = len(payload['batch']) if 'batch' in payload else 1
+            logger.info(f"Sending {count} reading(s) ({len(body)} bytes) to {url}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Payload: {body.decode('utf-8')}")
+            
+            rejected = []
+            async with self._session.post(url, data=body) as response:
+                status = response.status
+                if status >= 300:
+                    error_text = await response.text()
+                elif url == self._batch_url:
+                    try:
+                        rejected = (await response.json(content_type=None)).get('rejected') or []
+                    except Exception:
+                        rejected = []
             
-            if response.status_code < 300:
-                logger.info(f"✓ HTTP request successful (status: {response.status_code})")
+            if status < 300:
+                logger.info(f"✓ HTTP request successful (status: {status})")
+                self._backoff_until = 0.0
+                if rejected:
+                    logger.error(f"Server rejected {len(rejected)} of {len(payload['batch'])} "
+                                 f"batched readings, dropped: {rejected}")
                 return True
+            elif status in REJECTED_STATUSES:
+                # Server is up; the payload is bad, so neither retry it nor back off
+                self._backoff_until = 0.0
+                if url == self._batch_url:
+                    logger.warning(f"Server rejected batch (status {status}): {error_text}")
+                    self._batch_rejected = True
+                    return False
+                logger.error(f"Server rejected reading (status {status}), dropping it: {error_text}")
+                return True
+            elif url == self._batch_url and status in (404, 405):
+                # Server is up but only accepts single readings; not a failure
+                logger.warning(f"Server has no batch endpoint (status {status}), "
+                               f"sending buffered readings one at a time")
+                self._batch_url = None
+                return False
             else:
-                logger.warning(f"Server returned status {response.status_code}: {response.text}")
-                self.consecutive_failures += 1
+                logger.warning(f"Server returned status {status}: {error_text}")
+                self._record_failure()
                 return False
                 
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             logger.warning("HTTP request timed out")
-            self.consecutive_failures += 1
+            self._record_failure()
             return False
-        except requests.exceptions.ConnectionError:
+        except aiohttp.ClientConnectionError:
             logger.warning("Connection to server failed")
-            self.consecutive_failures += 1
+            self._record_failure()
             return False
         except Exception as e:
             logger.error(f"HTTP send error: {e}")
-            self.consecutive_failures += 1
+            self._record_failure()
             return False
     
+    def _record_failure(self):
+        """Count a failed send and back off exponentially once failures pile up"""
+        self.consecutive_failures += 1
+        
+        if self.consecutive_failures >= self.max_failures_before_buffer:
+            delay = min(BACKOFF_MAX_S, 2 ** min(self.consecutive_failures, 8))
+            self._backoff_until = time.monotonic() + delay
+            logger.warning(f"Backing off HTTP sends for {delay}s")
+    
+    def _open_wal(self, path: str):
+        """
+        Replay and open the on-disk copy of the buffer
+        
+        Args:
+            path: JSON-lines file holding one buffered payload per line
+        """
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = b''
+            
+            # A power loss mid-append leaves an unterminated last line; drop it so
+            # the next append starts on a fresh line instead of being glued onto it
+            complete = data.rfind(b'\n') + 1
+            torn = len(data) > complete
+            lines = data[:complete].splitlines()
+            
+            for line in lines:
+                try:
+                    self.buffer.append(_loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping corrupt line in {path}")
+                    continue
+            
+            self._wal_fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._wal_path = path
+            self._wal_entries = len(lines)
+            
+            if torn:
+                os.ftruncate(self._wal_fd, complete)
+                logger.warning(f"Dropped a partially written reading at the end of {path}")
+            
+            if self.buffer:
+                logger.info(f"Restored {len(self.buffer)} buffered readings from {path}")
+            
+        except OSError as e:
+            logger.warning(f"Buffer persistence disabled ({path}): {e}")
+    
+    def _rewrite_wal(self):
+        """
+        Replace the on-disk buffer with the readings still in memory
+        
+        Written to a temporary file and renamed over the old one, so a power
+        loss leaves either the old or the new contents, never an empty file.
+        """
+        if self._wal_fd is None:
+            return
+        
+        tmp_path = f"{self._wal_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b''.join(_dumps(payload) + b'\n' for payload in self.buffer))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._wal_path)
+            
+            # The old descriptor still points at the replaced file
+            fd = os.open(self._wal_path, os.O_WRONLY | os.O_APPEND)
+            os.close(self._wal_fd)
+            self._wal_fd = fd
+            self._wal_entries = len(self.buffer)
+        except OSError as e:
+            logger.warning(f"Failed to rewrite buffer file {self._wal_path}: {e}")
+    
     async def _buffer_data(self, payload: Dict[str, Any]):
-        """Add data to memory buffer"""
+        """
+        Add data to memory buffer and its on-disk copy
+        
+        Each append is flushed with fdatasync so a reading buffered before a power
+        cut survives it. Appends only happen while the server is unreachable, so
+        the sync cost stays off the normal send path.
+        """
         self.buffer.append(payload)
+        
+        if self._wal_fd is not None:
+            try:
+                os.write(self._wal_fd, _dumps(payload) + b'\n')
+                os.fdatasync(self._wal_fd)
+                self._wal_entries += 1
+            except OSError as e:
+                logger.warning(f"Failed to persist buffered reading: {e}")
+            
+            # Entries evicted from the full deque are still on disk; compact occasionally
+            if self._wal_entries > 2 * self.max_buffer_size:
+                self._rewrite_wal()
         logger.warning(f"Data buffered ({len(self.buffer)}/{self.max_buffer_size}) - "
                       f"{self.consecutive_failures} consecutive failures")
         
@@ -226,8 +537,16 @@ class HTTPDataSender:
         if len(self.buffer) >= self.max_buffer_size * 0.8:
             logger.warning(f"Buffer nearly full: {len(self.buffer)}/{self.max_buffer_size}")
     
+    async def _buffer_batch(self, batch: List[Dict[str, Any]]):
+        """Buffer each payload of a batch, so one bad payload cannot lose the rest"""
+        for payload in batch:
+            try:
+                await self._buffer_data(payload)
+            except Exception as e:
+                logger.error(f"Failed to buffer reading from {payload.get('timestamp')}: {e}")
+    
     async def _send_buffered_data(self):
-        """Attempt to send buffered data"""
+        """Attempt to send buffered data, in batches of up to BATCH_MAX_PAYLOADS"""
         if not self.buffer:
             return
         
@@ -235,39 +554,51 @@ class HTTPDataSender:
         
         # Send buffered data (oldest first)
         sent_count = 0
-        while self.buffer and sent_count < 10:  # Limit batch size
-            payload = self.buffer.popleft()
-            
-            success = await self._send_data(payload)
-            if success:
-                sent_count += 1
-            else:
-                # Put back and stop trying
-                self.buffer.appendleft(payload)
-                break
+        try:
+            while self.buffer:
+                batch = [self.buffer.popleft() for _ in range(min(BATCH_MAX_PAYLOADS, len(self.buffer)))]
                 
-        if sent_count > 0:
-            logger.info(f"Successfully sent {sent_count} buffered readings")
+                sent = 0
+                try:
+                    sent = await self._send_many(batch)
+                finally:
+                    if sent < len(batch):
+                        # Put the rest back in original order (also when cancelled mid-send)
+                        self.buffer.extendleft(reversed(batch[sent:]))
+                
+                sent_count += sent
+                if sent < len(batch):
+                    break
+        finally:
+            if sent_count > 0:
+                self._rewrite_wal()
+                logger.info(f"Successfully sent {sent_count} buffered readings")
     
-    async def _get_system_info(self) -> Dict[str, Any]:
-        """Get basic system info to include with data"""
+    def _sample_system_info(self):
+        """Refresh the basic system info included with data"""
         try:
-            import psutil
-            
-            return {
+            self._sys_info = {
                 'memory_percent': psutil.virtual_memory().percent,
                 'cpu_temp': self._get_cpu_temp(),
                 'uptime_seconds': psutil.boot_time()
             }
-        except Exception:
-            return {}
+        except Exception as e:
+            logger.debug(f"Failed to sample system info: {e}")
+    
+    async def _sys_info_loop(self):
+        """Periodically refresh the cached system info off the send path"""
+        while True:
+            await asyncio.sleep(SYS_INFO_INTERVAL)
+            self._sample_system_info()
     
     def _get_cpu_temp(self) -> Optional[float]:
         """Get CPU temperature on Pi"""
+        if self._temp_file is None:
+            return None
+        
         try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                temp = float(f.read()) / 1000.0
-                return temp
+            self._temp_file.seek(0)
+            return int(self._temp_file.read()) / 1000.0
         except Exception:
             return None
     
@@ -281,9 +612,11 @@ class HTTPDataSender:
         return {
             'initialized': self.initialized,
             'server_url': self.server_url,
+            'queued': self._queue.qsize() if self._queue else 0,
             'buffer_count': len(self.buffer),
             'buffer_capacity': self.max_buffer_size,
             'consecutive_failures': self.consecutive_failures,
+            'backoff_remaining': max(0.0, self._backoff_until - time.monotonic()),
             'last_successful_send': self.last_successful_send.isoformat() if self.last_successful_send else None,
             'timeout': self.timeout
         }
@@ -291,8 +624,52 @@ class HTTPDataSender:
     async def cleanup(self):
         """Cleanup HTTP sender resources"""
         try:
+            # Cleared first so _on_sender_done() no longer restarts it
+            sender_task, self._sender_task = self._sender_task, None
+            if sender_task:
+                # Give queued readings one chance to go out, then keep the rest in the buffer
+                self._queue.put_nowait(None)
+                try:
+                    await asyncio.wait_for(sender_task, self.timeout)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    pass
+                except Exception as e:
+                    logger.error(f"HTTP sender task failed during shutdown: {e}")
+                
+                leftover = []
+                while not self._queue.empty():
+                    payload = self._queue.get_nowait()
+                    if payload is not None:
+                        leftover.append(payload)
+                self._queue = None
+                await self._buffer_batch(leftover)
+            
             if len(self.buffer) > 0:
-                logger.warning(f"Shutting down with {len(self.buffer)} unsent readings in buffer")
+                if self._wal_fd is not None:
+                    logger.info(f"Shutting down with {len(self.buffer)} unsent readings "
+                                f"saved to {self._wal_path}")
+                else:
+                    logger.warning(f"Shutting down with {len(self.buffer)} unsent readings in buffer")
+            
+            if self._sys_info_task:
+                self._sys_info_task.cancel()
+                try:
+                    await self._sys_info_task
+                except asyncio.CancelledError:
+                    pass
+                self._sys_info_task = None
+            
+            if self._session:
+                await self._session.close()
+                self._session = None
+            
+            if self._temp_file:
+                self._temp_file.close()
+                self._temp_file = None
+            
+            if self._wal_fd is not None:
+                os.close(self._wal_fd)
+                self._wal_fd = None
             
             self.initialized = False
             logger.info("HTTP Data Sender cleanup complete")
@@ -4,22 +4,44 @@ Handles I2C communication using adafruit-circuitpython libraries
 Optimized for Raspberry Pi 1 Model B+ ARM6 architecture
 """
 
+import os
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import struct
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List
 import board
 import busio
 from adafruit_bus_device.i2c_device import I2CDevice
 
+from .realtime import settle_ns, try_realtime
+
 logger = logging.getLogger(__name__)
 
+# Fast-mode by default; every device on this bus (ADS1115) supports 400 kHz
+DEFAULT_I2C_FREQ = 400000
+FALLBACK_I2C_FREQ = 100000
+
+# try_lock() attempts (yielding to the event loop in between) before giving up
+BUS_LOCK_ATTEMPTS = 100
+
+# Zero-length write used to probe for an ACK during bus scans
+_PROBE = bytes()
+
 class I2CService:
     """I2C communication service using CircuitPython libraries"""
     
     def __init__(self):
         self.initialized = False
         self.i2c_bus: Optional[busio.I2C] = None
+        self._freq: Optional[int] = None
         self.connected_devices: Dict[int, I2CDevice] = {}
+        
+        # Reusable per-device transfer buffers: (word write, word read, register pointer)
+        self._buffers: Dict[int, tuple] = {}
+        
+        # Addresses found by the last scan_bus(), reused until refreshed
+        self._last_scan: Optional[List[int]] = None
     
     async def initialize(self):
         """Initialize I2C service"""
@@ -30,8 +52,20 @@ class I2CService:
         try:
             logger.info("Initializing I2C service...")
             
+            # Conversion waits and register writes are timing sensitive
+            try_realtime()
+            
             # Initialize I2C bus using CircuitPython
-            self.i2c_bus = busio.I2C(board.SCL, board.SDA, frequency=100000)
+            freq = int(os.getenv('I2C_FREQ', DEFAULT_I2C_FREQ))
+            try:
+                self.i2c_bus = busio.I2C(board.SCL, board.SDA, frequency=freq)
+            except Exception as e:
+                if freq == FALLBACK_I2C_FREQ:
+                    raise
+                logger.warning(f"I2C init at {freq} Hz failed ({e}), retrying at {FALLBACK_I2C_FREQ} Hz")
+                freq = FALLBACK_I2C_FREQ
+                self.i2c_bus = busio.I2C(board.SCL, board.SDA, frequency=freq)
+            self._freq = freq
             
             # Test I2C bus availability
             if not self.i2c_bus.try_lock():
@@ -41,13 +75,13 @@ class I2CService:
             self.i2c_bus.unlock()
             
             self.initialized = True
-            logger.info("I2C service initialized successfully")
+            logger.info(f"I2C service initialized successfully ({self._freq} Hz)")
             
         except Exception as e:
             logger.error(f"Failed to initialize I2C service: {e}")
             raise
     
-    async def connect_device(self, address: int) -> I2CDevice:
+    def connect_device(self, address: int) -> I2CDevice:
         """
         Connect to an I2C device
         
@@ -67,6 +101,7 @@ class I2CService:
             # Create I2C device instance
             device = I2CDevice(self.i2c_bus, address)
             self.connected_devices[address] = device
+            self._buffers[address] = (bytearray(3), bytearray(2), bytearray(1))
             
             logger.info(f"Connected to I2C device at address 0x{address:02x}")
             return device
@@ -75,7 +110,7 @@ class I2CService:
             logger.error(f"Failed to connect to I2C device 0x{address:02x}: {e}")
             raise
     
-    async def write_word_data(self, address: int, register: int, data: int):
+    def write_word_data(self, address: int, register: int, data: int, settle_us: int = 0):
         """
         Write 16-bit word data to a register
         
@@ -83,27 +118,28 @@ class I2CService:
             address: I2C device address
             register: Register address
             data: 16-bit data to write
+            settle_us: Delay after the write for registers that need one (microseconds)
         """
-        device = await self.connect_device(address)
+        device = self.connect_device(address)
         
         try:
-            # Convert to big-endian format for I2C
-            high_byte = (data >> 8) & 0xFF
-            low_byte = data & 0xFF
-            buffer = bytes([register, high_byte, low_byte])
+            # Register pointer followed by the big-endian word
+            buffer = self._buffers[address][0]
+            struct.pack_into('>BH', buffer, 0, register, data & 0xFFFF)
             
             # Write with device context manager
             with device:
                 device.write(buffer)
                 
-            # Small delay for device processing
-            await asyncio.sleep(0.001)
+            # Only for registers that need device processing time
+            if settle_us:
+                settle_ns(settle_us * 1000)
             
         except Exception as e:
             logger.error(f"Failed to write word data to 0x{address:02x} reg 0x{register:02x}: {e}")
             raise
     
-    async def read_word_data(self, address: int, register: int) -> int:
+    def read_word_data(self, address: int, register: int) -> int:
         """
         Read 16-bit word data from a register
         
@@ -114,12 +150,12 @@ class I2CService:
         Returns:
             16-bit data value
         """
-        device = await self.connect_device(address)
+        device = self.connect_device(address)
         
         try:
             # Write register address first, then read data
-            write_buffer = bytes([register])
-            read_buffer = bytearray(2)
+            _, read_buffer, write_buffer = self._buffers[address]
+            write_buffer[0] = register
             
             with device:
                 device.write_then_readinto(write_buffer, read_buffer)
@@ -132,30 +168,84 @@ class I2CService:
             logger.error(f"Failed to read word data from 0x{address:02x} reg 0x{register:02x}: {e}")
             raise
     
-    async def scan_bus(self) -> list[int]:
+    def read_block(self, address: int, register: int, nbytes: int) -> bytearray:
+        """
+        Read consecutive registers in one transaction (register pointer auto-increments)
+        
+        Args:
+            address: I2C device address
+            register: First register address
+            nbytes: Number of bytes to read
+            
+        Returns:
+            Bytes read, in register order
+        """
+        device = self.connect_device(address)
+        
+        try:
+            write_buffer = self._buffers[address][2]
+            write_buffer[0] = register
+            read_buffer = bytearray(nbytes)
+            
+            with device:
+                device.write_then_readinto(write_buffer, read_buffer)
+            
+            return read_buffer
+            
+        except Exception as e:
+            logger.error(f"Failed to read {nbytes} bytes from 0x{address:02x} reg 0x{register:02x}: {e}")
+            raise
+    
+    @asynccontextmanager
+    async def bus_session(self):
+        """
+        Hold the I2C bus lock across a burst of raw transactions
+        
+        Yields:
+            The locked busio.I2C bus
+        """
+        if not self.initialized:
+            raise RuntimeError("I2C service not initialized")
+        
+        for _ in range(BUS_LOCK_ATTEMPTS):
+            if self.i2c_bus.try_lock():
+                break
+            await asyncio.sleep(0)
+        else:
+            raise RuntimeError("Could not acquire I2C bus lock")
+        
+        try:
+            yield self.i2c_bus
+        finally:
+            self.i2c_bus.unlock()
+    
+    async def scan_bus(self, refresh: bool = False) -> List[int]:
         """
         Scan I2C bus for connected devices
         
+        Args:
+            refresh: Probe the bus again instead of returning the last scan result
+            
         Returns:
             List of detected device addresses
         """
         if not self.initialized:
             raise RuntimeError("I2C service not initialized")
         
+        if self._last_scan is not None and not refresh:
+            return list(self._last_scan)
+        
         devices = []
         logger.info("Scanning I2C bus...")
         
         try:
-            # Lock the bus for scanning
-            while not self.i2c_bus.try_lock():
-                await asyncio.sleep(0.01)
-            
-            try:
+            # Lock the bus once for the whole scan
+            async with self.bus_session() as bus:
                 # Scan common I2C addresses (0x08 to 0x77)
                 for address in range(0x08, 0x78):
                     try:
                         # Try to communicate with the device
-                        self.i2c_bus.writeto(address, bytes())
+                        bus.writeto(address, _PROBE)
                         devices.append(address)
                         logger.info(f"Found device at address 0x{address:02x}")
                     except OSError:
@@ -163,16 +253,15 @@ class I2CService:
                         pass
                     except Exception as e:
                         logger.debug(f"Error scanning address 0x{address:02x}: {e}")
-            finally:
-                self.i2c_bus.unlock()
                 
         except Exception as e:
             logger.error(f"Failed to scan I2C bus: {e}")
             raise
         
+        self._last_scan = devices
         logger.info(f"I2C scan complete. Found {len(devices)} devices: "
                    f"{[f'0x{addr:02x}' for addr in devices]}")
-        return devices
+        return list(devices)
     
     async def test_device(self, address: int) -> bool:
         """
@@ -185,7 +274,7 @@ class I2CService:
             True if device responds, False otherwise
         """
         try:
-            device = await self.connect_device(address)
+            device = self.connect_device(address)
             
             # Try a simple communication test
             with device:
@@ -209,7 +298,7 @@ class I2CService:
         return {
             'initialized': self.initialized,
             'connected_devices': list(self.connected_devices.keys()),
-            'bus_frequency': 100000 if self.i2c_bus else None
+            'bus_frequency': self._freq if self.i2c_bus else None
         }
     
     async def shutdown(self):
@@ -222,6 +311,8 @@ class I2CService:
             
             # Clear connected devices
             self.connected_devices.clear()
+            self._buffers.clear()
+            self._last_scan = None
             
             # Deinitialize I2C bus if available
             if self.i2c_bus:
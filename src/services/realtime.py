@@ -0,0 +1,69 @@
+"""
+Realtime helpers for FuseTester
+SCHED_FIFO priority and short busy-wait delays for GPIO/I2C timing
+"""
+
+import os
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# SCHED_FIFO priority (1-99); low enough to stay below kernel IRQ threads (50)
+DEFAULT_REALTIME_PRIORITY = 10
+
+_attempted = False
+
+def try_realtime() -> bool:
+    """
+    Switch the process to SCHED_FIFO once, logging and continuing if not permitted
+
+    REALTIME_PRIORITY=0 disables this. REALTIME_CPU pins the process to one core
+    on multi-core boards (the Pi 1 B+ has a single core, so it is unset by default).
+    The kernel's RT throttling (sched_rt_runtime_us) still reserves time for other
+    tasks, so the short busy-wait settles cannot lock up the system.
+
+    Returns:
+        True if the process is running with realtime priority
+    """
+    global _attempted
+    if _attempted:
+        return os.sched_getscheduler(0) == os.SCHED_FIFO
+    _attempted = True
+
+    priority = int(os.getenv('REALTIME_PRIORITY', DEFAULT_REALTIME_PRIORITY))
+    if priority <= 0:
+        logger.info("Realtime scheduling disabled (REALTIME_PRIORITY=0)")
+        return False
+
+    cpu = os.getenv('REALTIME_CPU')
+    if cpu:
+        try:
+            os.sched_setaffinity(0, {int(cpu)})
+            logger.info(f"Pinned process to CPU {cpu}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not pin process to CPU {cpu}: {e}")
+
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        logger.info(f"Running with SCHED_FIFO priority {priority}")
+        return True
+    except PermissionError:
+        logger.warning("No permission for SCHED_FIFO (needs root or CAP_SYS_NICE), "
+                       "continuing with normal scheduling")
+    except (OSError, AttributeError) as e:
+        logger.warning(f"Realtime scheduling unavailable, continuing with normal scheduling: {e}")
+    return False
+
+def settle_ns(ns: int):
+    """
+    Busy-wait for a sub-microsecond to few-microsecond delay
+    
+    Far shorter than an event loop wakeup or time.sleep() granularity.
+    
+    Args:
+        ns: Delay in nanoseconds
+    """
+    deadline = time.perf_counter_ns() + ns
+    while time.perf_counter_ns() < deadline:
+        pass
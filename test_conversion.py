@@ -6,6 +6,7 @@ Basic functionality test for Python services
 
 import sys
 import asyncio
+import importlib.util
 import logging
 from pathlib import Path
 
@@ -17,14 +18,19 @@ async def test_imports():
     print("Testing Python imports...")
     
     try:
-        from services.i2c_service import I2CService
-        from services.gpio_service import GPIOService  
-        from services.ads1115_service import ADS1115Service
-        from services.csv_logger import CSVLogger
-        from services.fuse_monitor_service import FuseMonitorService
+        # One statement: the services package is resolved once for all submodules
+        from services import (i2c_service, gpio_service, ads1115_service,
+                              http_data_sender, fuse_monitor_service)
+        assert all(hasattr(module, name) for module, name in (
+            (i2c_service, 'I2CService'),
+            (gpio_service, 'GPIOService'),
+            (ads1115_service, 'ADS1115Service'),
+            (http_data_sender, 'CSVLogger'),
+            (fuse_monitor_service, 'FuseMonitorService'),
+        )), "service class missing"
         print("✓ All service modules imported successfully")
         return True
-    except ImportError as e:
+    except (ImportError, AssertionError) as e:
         print(f"❌ Import failed: {e}")
         return False
 
@@ -36,17 +42,23 @@ async def test_hardware_libraries():
         'RPi.GPIO': 'GPIO control',
         'board': 'CircuitPython board interface',
         'busio': 'CircuitPython I2C bus',
-        'adafruit_ads1x15.ads1115': 'ADS1115 ADC library',
+        'smbus2': 'ADS1115 I2C register access',
         'psutil': 'System monitoring'
     }
     
     all_passed = True
     
     for lib, description in libraries.items():
+        # Locate without importing: importing RPi.GPIO/board touches the hardware
         try:
-            __import__(lib)
-            print(f"✓ {lib} - {description}")
+            available = importlib.util.find_spec(lib) is not None
         except ImportError:
+            # Parent package of a dotted name (e.g. RPi) is missing
+            available = False
+        
+        if available:
+            print(f"✓ {lib} - {description}")
+        else:
             print(f"❌ {lib} - {description} (not available)")
             all_passed = False
     
@@ -76,12 +88,18 @@ async def main():
     logging.basicConfig(level=logging.WARNING)
     
     tests = [
-        test_imports(),
-        test_hardware_libraries(), 
-        test_service_creation()
+        test_imports,
+        test_hardware_libraries, 
+        test_service_creation
     ]
     
-    results = await asyncio.gather(*tests, return_exceptions=True)
+    # Run in order; none of these do I/O worth overlapping, and the output stays ordered
+    results = []
+    for test in tests:
+        try:
+            results.append(await test())
+        except Exception as e:
+            results.append(e)
     
     passed = sum(1 for result in results if result is True)
     total = len(results)
@@ -5,6 +5,7 @@ Test specific ADC channels and multiplexer inputs interactively
 
 Usage:
     python3 test_hardware.py
+    FUSE_SETTLING_S=0.1 python3 test_hardware.py   (override the MUX settling time)
     
 This script allows you to:
 - Select a specific ADC channel (0-3)  
@@ -15,7 +16,10 @@ This script allows you to:
 
 import asyncio
 import logging
+import os
+import struct
 import sys
+from collections import deque
 from pathlib import Path
 
 # Add src directory to path
@@ -33,19 +37,39 @@ logging.basicConfig(
 
 logger = logging.getLogger('hardware_test')
 
+# One sample: adc_channel, mux_number, mux_input, fuse_number, voltage (8 bytes)
+SAMPLE_RECORD = struct.Struct('<BBBBf')
+SAMPLE_BUFFER_SIZE = 1024  # records kept before the oldest are overwritten
+
 class HardwareTester:
     """Interactive hardware testing utility"""
     
+    # Analog settling time after switching a MUX input (seconds). The RC of the MUX
+    # path (~1 kOhm into ~10 nF) is ~10 us, so 5 ms leaves a wide safety margin
+    SETTLING_S = float(os.getenv('FUSE_SETTLING_S', '0.005'))
+    MIN_SETTLING_S = 0.001
+    
     def __init__(self):
         self.gpio_service = None
         self.ads1115_service = None
         self.initialized = False
+        self._mux_clean = True  # No multiplexer enabled since the last disable_all_mux()
+        
+        # Recent samples from every mode, as SAMPLE_RECORD bytes (oldest dropped first)
+        self.sample_buffer = deque(maxlen=SAMPLE_BUFFER_SIZE)
+        
+        # (mux_number, fuse_number) per [adc_channel][mux_input]; ADC0->MUX0 ... ADC3->MUX3
+        self._fuse_table = [[(c, c * 16 + m + 1) for m in range(16)] for c in range(4)]
     
     async def initialize(self):
         """Initialize GPIO and ADS1115 services"""
         try:
             logger.info("Initializing hardware services...")
             
+            if self.SETTLING_S < self.MIN_SETTLING_S:
+                logger.warning(f"MUX settling time {self.SETTLING_S * 1000:.2f}ms is below "
+                               f"{self.MIN_SETTLING_S * 1000:.0f}ms, readings may not be settled")
+            
             # Initialize GPIO service
             self.gpio_service = GPIOService()
             await self.gpio_service.initialize()
@@ -66,59 +90,69 @@ class HardwareTester:
             logger.error(f"Failed to initialize hardware: {e}")
             raise
     
-    async def test_specific_input(self, adc_channel: int, mux_input: int):
+    async def __aenter__(self):
+        try:
+            await self.initialize()
+        except Exception:
+            await self.cleanup()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+    
+    async def test_specific_input(self, adc_channel: int, mux_input: int, quiet: bool = False):
         """
         Test a specific ADC channel and multiplexer input combination
         
         Args:
             adc_channel: ADC channel (0-3)
             mux_input: Multiplexer input (0-15)
+            quiet: Only return the result, without logging it
         """
-        if not self.initialized:
-            raise RuntimeError("Hardware not initialized")
+        verbose = not quiet and logger.isEnabledFor(logging.INFO)
         
         try:
-            logger.info(f"Testing ADC channel {adc_channel}, MUX input {mux_input}")
+            if verbose:
+                logger.info(f"Testing ADC channel {adc_channel}, MUX input {mux_input}")
             
-            # First, disable all multiplexers to ensure clean state
-            await self.gpio_service.disable_all_mux()
-            logger.debug("✓ All MUXes disabled")
-            
-            # Calculate which multiplexer this corresponds to
-            # ADC0->MUX0, ADC1->MUX1, ADC2->MUX2, ADC3->MUX3
-            mux_number = adc_channel
+            # Multiplexer and fuse number this combination corresponds to
+            mux_number, fuse_number = self._fuse_table[adc_channel][mux_input]
             
             # Set multiplexer channel
-            await self.gpio_service.set_mux_channel(mux_input)
-            logger.info(f"✓ Set MUX channel to {mux_input}")
+            self.gpio_service.set_mux_channel(mux_input)
+            if verbose:
+                logger.info(f"✓ Set MUX channel to {mux_input}")
             
-            # Enable the specific multiplexer
-            await self.gpio_service.enable_mux(mux_number)
-            logger.info(f"✓ Enabled MUX {mux_number}")
+            # Enable the specific multiplexer; this also disables whichever one was enabled
+            self.gpio_service.enable_mux(mux_number)
+            self._mux_clean = False
+            if verbose:
+                logger.info(f"✓ Enabled MUX {mux_number}")
             
             # Small delay for settling
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(self.SETTLING_S)
             
             # Read voltage from ADC channel
             voltage = await self.ads1115_service.read_channel(adc_channel)
             
-            # Calculate fuse number (for reference)
-            fuse_number = (mux_number * 16) + mux_input + 1
-            
-            logger.info(f"📊 Results:")
-            logger.info(f"   ADC Channel: {adc_channel}")
-            logger.info(f"   MUX Number: {mux_number}")
-            logger.info(f"   MUX Input: {mux_input}")
-            logger.info(f"   Fuse Number: {fuse_number}")
-            logger.info(f"   Voltage: {voltage:.4f}V")
+            if verbose:
+                logger.info(f"📊 Results:\n"
+                            f"   ADC Channel: {adc_channel}\n"
+                            f"   MUX Number: {mux_number}\n"
+                            f"   MUX Input: {mux_input}\n"
+                            f"   Fuse Number: {fuse_number}\n"
+                            f"   Voltage: {voltage:.4f}V")
             
-            return {
+            result = {
                 'adc_channel': adc_channel,
                 'mux_number': mux_number,
                 'mux_input': mux_input,
                 'fuse_number': fuse_number,
                 'voltage': voltage
             }
+            self._record(result)
+            return result
             
         except Exception as e:
             logger.error(f"Test failed: {e}")
@@ -133,44 +167,209 @@ class HardwareTester:
         """
         logger.info(f"Testing all ADC channels with MUX input {mux_input}")
         
+        # The channel is shared by all muxes, so it is set once; enabling a mux disables the others
+        self.gpio_service.disable_all_mux()
+        self.gpio_service.set_mux_channel(mux_input)
+        self._mux_clean = False  # The loop below enables each mux in turn
+        
+        # Bound once outside the loop
+        enable_mux = self.gpio_service.enable_mux
+        read = self.ads1115_service.read_channel
+        record = self._record
+        sleep = asyncio.sleep
+        settling = self.SETTLING_S
+        
+        fuse_table = self._fuse_table
+        
         results = []
         for adc_channel in range(4):
             try:
-                result = await self.test_specific_input(adc_channel, mux_input)
+                enable_mux(adc_channel)
+                await sleep(settling)
+                voltage = await read(adc_channel)
+                result = {
+                    'adc_channel': adc_channel,
+                    'mux_number': adc_channel,
+                    'mux_input': mux_input,
+                    'fuse_number': fuse_table[adc_channel][mux_input][1],
+                    'voltage': voltage
+                }
+                record(result)
                 results.append(result)
-                await asyncio.sleep(0.2)  # Small delay between readings
             except Exception as e:
                 logger.error(f"Failed to test ADC {adc_channel}: {e}")
         
         return results
     
-    async def test_mux_sweep(self, adc_channel: int = 0):
+    async def sweep_mux(self, adc_channel: int):
         """
-        Test all multiplexer inputs on a single ADC channel
+        Read all 16 inputs of the multiplexer on an ADC channel, enabling it only once
+        
+        Pipelined: each input is converted right after it settles, and its result
+        is read back while the next input settles. The MUX only switches once the
+        conversion window has passed, so samples never straddle two inputs.
+        
+        In RDY continuous mode (ADS1115_RDY_GPIO set) the chip converts on its own
+        schedule, so inputs are read one at a time with read_channel() instead.
         
         Args:
-            adc_channel: ADC channel to test (0-3)
+            adc_channel: ADC channel to sweep (0-3), MUX number is the same
+            
+        Returns:
+            List of result dictionaries, one per MUX input
         """
-        logger.info(f"Testing all MUX inputs on ADC channel {adc_channel}")
+        if self.ads1115_service.continuous:
+            return await self._sweep_mux_sequential(adc_channel)
+        
+        # Bound once outside the loop
+        now = asyncio.get_running_loop().time
+        set_mux = self.gpio_service.set_mux_channel
+        start = self.ads1115_service.start_conversion
+        read = self.ads1115_service.read_conversion
+        record = self._record
+        sleep = asyncio.sleep
+        settling = self.SETTLING_S
+        conversion_time = self.ads1115_service.conversion_time
+        fuse_row = self._fuse_table[adc_channel]
+        
+        self.gpio_service.enable_mux(adc_channel)
+        self._mux_clean = False
+        
+        set_mux(0)
+        await sleep(settling)
+        await start(adc_channel)
+        
+        results = []
+        for mux_input in range(1, 17):
+            # Input mux_input - 1 is being sampled; hold the MUX until it is done
+            await sleep(conversion_time)
+            settle_start = now()
+            if mux_input < 16:
+                set_mux(mux_input)
+            
+            previous = mux_input - 1
+            try:
+                voltage = await read()
+                result = {
+                    'adc_channel': adc_channel,
+                    'mux_number': adc_channel,
+                    'mux_input': previous,
+                    'fuse_number': fuse_row[previous][1],
+                    'voltage': voltage
+                }
+                record(result)
+                results.append(result)
+            except Exception as e:
+                logger.error(f"Failed to test MUX input {previous}: {e}")
+            
+            if mux_input < 16:
+                # The read-back above counts towards this input's settling time
+                remaining = settling - (now() - settle_start)
+                if remaining > 0:
+                    await sleep(remaining)
+                await start(adc_channel)
+        
+        return results
+    
+    async def _sweep_mux_sequential(self, adc_channel: int):
+        """
+        Read all 16 inputs of the multiplexer on an ADC channel, settling and reading each in turn
+        
+        Args:
+            adc_channel: ADC channel to sweep (0-3), MUX number is the same
+            
+        Returns:
+            List of result dictionaries, one per MUX input
+        """
+        # Bound once outside the loop
+        set_mux = self.gpio_service.set_mux_channel
+        read = self.ads1115_service.read_channel
+        record = self._record
+        sleep = asyncio.sleep
+        settling = self.SETTLING_S
+        fuse_row = self._fuse_table[adc_channel]
+        
+        self.gpio_service.enable_mux(adc_channel)
+        self._mux_clean = False
         
         results = []
         for mux_input in range(16):
             try:
-                result = await self.test_specific_input(adc_channel, mux_input)
+                set_mux(mux_input)
+                await sleep(settling)
+                voltage = await read(adc_channel)
+                result = {
+                    'adc_channel': adc_channel,
+                    'mux_number': adc_channel,
+                    'mux_input': mux_input,
+                    'fuse_number': fuse_row[mux_input][1],
+                    'voltage': voltage
+                }
+                record(result)
                 results.append(result)
-                await asyncio.sleep(0.2)  # Small delay between readings
             except Exception as e:
                 logger.error(f"Failed to test MUX input {mux_input}: {e}")
         
         return results
     
+    async def test_mux_sweep(self, adc_channel: int = 0):
+        """
+        Test all multiplexer inputs on a single ADC channel
+        
+        Args:
+            adc_channel: ADC channel to test (0-3)
+        """
+        logger.info(f"Testing all MUX inputs on ADC channel {adc_channel}")
+        return await self.sweep_mux(adc_channel)
+    
+    async def monitor_input(self, adc_channel: int, mux_input: int, interval: float):
+        """
+        Read one input repeatedly and print each sample until cancelled
+        
+        Args:
+            adc_channel: ADC channel (0-3)
+            mux_input: Multiplexer input (0-15)
+            interval: Seconds between readings
+        """
+        self.sample_buffer.clear()  # Only print samples from this run
+        while True:
+            await self.test_specific_input(adc_channel, mux_input, quiet=True)
+            packet = self.get_packet(self.get_available())
+            for _, _, _, fuse_number, voltage in SAMPLE_RECORD.iter_unpack(packet):
+                print(f"Fuse {fuse_number}: {voltage:.4f}V")
+            await asyncio.sleep(interval)
+    
+    def _record(self, result: dict):
+        """Append a result to the sample buffer"""
+        self.sample_buffer.append(SAMPLE_RECORD.pack(
+            result['adc_channel'], result['mux_number'], result['mux_input'],
+            result['fuse_number'], result['voltage']))
+    
+    def get_available(self) -> int:
+        """Number of samples waiting in the sample buffer"""
+        return len(self.sample_buffer)
+    
+    def get_packet(self, n: int) -> bytes:
+        """
+        Take up to n of the oldest samples out of the sample buffer
+        
+        Args:
+            n: Maximum number of samples
+            
+        Returns:
+            Concatenated SAMPLE_RECORD records; decode with SAMPLE_RECORD.iter_unpack()
+        """
+        buffer = self.sample_buffer
+        return b''.join([buffer.popleft() for _ in range(min(n, len(buffer)))])
+    
     async def cleanup(self):
         """Cleanup hardware services"""
         try:
             # Disable all muxes before cleanup
-            if self.gpio_service and self.initialized:
+            if self.gpio_service and self.initialized and not self._mux_clean:
                 logger.info("Disabling all multiplexers...")
-                await self.gpio_service.disable_all_mux()
+                self.gpio_service.disable_all_mux()
+                self._mux_clean = True
                 logger.info("✓ All multiplexers disabled")
         except Exception as e:
             logger.warning(f"Error disabling muxes during cleanup: {e}")
@@ -179,115 +378,156 @@ class HardwareTester:
             await self.gpio_service.cleanup()
         if self.ads1115_service:
             await self.ads1115_service.cleanup()
+        self.initialized = False
         logger.info("✓ Hardware services cleaned up")
 
-async def interactive_test():
-    """Interactive testing mode"""
-    tester = HardwareTester()
+# Bytes read from stdin that are not yet part of a returned line
+_stdin_pending = bytearray()
+
+async def ainput(prompt: str = '') -> str:
+    """
+    Read a line from stdin without blocking the event loop
     
-    # try:
-    await tester.initialize()
+    Waits on the stdin descriptor with loop.add_reader() instead of running
+    input() on a thread: a blocked input() cannot be interrupted, so Ctrl+C
+    would hang until Enter was pressed.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
     
-    print("\n" + "="*60)
-    print("🔧 FuseTester Hardware Test Utility")
-    print("="*60)
-    print()
-    print("Available commands:")
-    print("  1. Test specific ADC channel + MUX input")
-    print("  2. Test all ADC channels (same MUX input)")
-    print("  3. Test all MUX inputs (same ADC channel)")
-    print("  4. Continuous monitoring")
-    print("  5. Disable all multiplexers")
-    print("  q. Quit")
-    print()
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
     
-    while True:
+    while b'\n' not in _stdin_pending:
+        readable = loop.create_future()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
         try:
-            choice = input("Enter command (1-5, q): ").strip().lower()
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            raise EOFError("stdin closed")
+        _stdin_pending.extend(chunk)
+    
+    end = _stdin_pending.index(b'\n')
+    line = bytes(_stdin_pending[:end])
+    del _stdin_pending[:end + 1]
+    return line.decode(errors='replace').rstrip('\r')
+
+async def interactive_test():
+    """Interactive testing mode"""
+    async with HardwareTester() as tester:
+    
+        print("\n" + "="*60)
+        print("🔧 FuseTester Hardware Test Utility")
+        print("="*60)
+        print()
+        print("Available commands:")
+        print("  1. Test specific ADC channel + MUX input")
+        print("  2. Test all ADC channels (same MUX input)")
+        print("  3. Test all MUX inputs (same ADC channel)")
+        print("  4. Continuous monitoring")
+        print("  5. Disable all multiplexers")
+        print("  q. Quit")
+        print()
+    
+        while True:
+            try:
+                choice = (await ainput("Enter command (1-5, q): ")).strip().lower()
             
-            if choice == 'q':
-                break
-            elif choice == '1':
-                adc_ch = int(input("Enter ADC channel (0-3): "))
-                mux_in = int(input("Enter MUX input (0-15): "))
+                if choice == 'q':
+                    break
+                elif choice == '1':
+                    adc_ch = int(await ainput("Enter ADC channel (0-3): "))
+                    mux_in = int(await ainput("Enter MUX input (0-15): "))
                 
-                if not (0 <= adc_ch <= 3):
-                    print("❌ ADC channel must be 0-3")
-                    continue
-                if not (0 <= mux_in <= 15):
-                    print("❌ MUX input must be 0-15")
-                    continue
+                    if not (0 <= adc_ch <= 3):
+                        print("❌ ADC channel must be 0-3")
+                        continue
+                    if not (0 <= mux_in <= 15):
+                        print("❌ MUX input must be 0-15")
+                        continue
                 
-                await tester.test_specific_input(adc_ch, mux_in)
+                    await tester.test_specific_input(adc_ch, mux_in)
                 
-            elif choice == '2':
-                mux_in = int(input("Enter MUX input (0-15): "))
-                if not (0 <= mux_in <= 15):
-                    print("❌ MUX input must be 0-15")
-                    continue
+                elif choice == '2':
+                    mux_in = int(await ainput("Enter MUX input (0-15): "))
+                    if not (0 <= mux_in <= 15):
+                        print("❌ MUX input must be 0-15")
+                        continue
                 
-                results = await tester.test_all_adc_channels(mux_in)
-                print(f"\n📊 Summary for MUX input {mux_in}:")
-                for r in results:
-                    print(f"   ADC{r['adc_channel']} (Fuse {r['fuse_number']}): {r['voltage']:.4f}V")
+                    results = await tester.test_all_adc_channels(mux_in)
+                    # One write for the whole summary
+                    sys.stdout.write(f"\n📊 Summary for MUX input {mux_in}:\n" + "".join(
+                        f"   ADC{r['adc_channel']} (Fuse {r['fuse_number']}): {r['voltage']:.4f}V\n"
+                        for r in results))
                 
-            elif choice == '3':
-                adc_ch = int(input("Enter ADC channel (0-3): "))
-                if not (0 <= adc_ch <= 3):
-                    print("❌ ADC channel must be 0-3")
-                    continue
+                elif choice == '3':
+                    adc_ch = int(await ainput("Enter ADC channel (0-3): "))
+                    if not (0 <= adc_ch <= 3):
+                        print("❌ ADC channel must be 0-3")
+                        continue
                 
-                results = await tester.test_mux_sweep(adc_ch)
-                print(f"\n📊 Summary for ADC channel {adc_ch}:")
-                for r in results:
-                    print(f"   MUX{r['mux_input']:2d} (Fuse {r['fuse_number']}): {r['voltage']:.4f}V")
+                    results = await tester.test_mux_sweep(adc_ch)
+                    # One write for the whole summary
+                    sys.stdout.write(f"\n📊 Summary for ADC channel {adc_ch}:\n" + "".join(
+                        f"   MUX{r['mux_input']:2d} (Fuse {r['fuse_number']}): {r['voltage']:.4f}V\n"
+                        for r in results))
                 
-            elif choice == '4':
-                adc_ch = int(input("Enter ADC channel (0-3): "))
-                mux_in = int(input("Enter MUX input (0-15): "))
-                interval = float(input("Enter interval in seconds (default 1.0): ") or "1.0")
+                elif choice == '4':
+                    adc_ch = int(await ainput("Enter ADC channel (0-3): "))
+                    mux_in = int(await ainput("Enter MUX input (0-15): "))
+                    interval = float(await ainput("Enter interval in seconds (default 1.0): ") or "1.0")
                 
-                if not (0 <= adc_ch <= 3):
-                    print("❌ ADC channel must be 0-3")
-                    continue
-                if not (0 <= mux_in <= 15):
-                    print("❌ MUX input must be 0-15")
-                    continue
+                    if not (0 <= adc_ch <= 3):
+                        print("❌ ADC channel must be 0-3")
+                        continue
+                    if not (0 <= mux_in <= 15):
+                        print("❌ MUX input must be 0-15")
+                        continue
                 
-                print(f"\n🔄 Continuous monitoring ADC{adc_ch}, MUX{mux_in} (Press Ctrl+C to stop)")
-                try:
-                    while True:
-                        result = await tester.test_specific_input(adc_ch, mux_in)
-                        print(f"Fuse {result['fuse_number']}: {result['voltage']:.4f}V")
-                        await asyncio.sleep(interval)
-                except KeyboardInterrupt:
-                    print("\n⏹️ Monitoring stopped")
+                    print(f"\n🔄 Continuous monitoring ADC{adc_ch}, MUX{mux_in} (Enter q to stop)")
+                    monitor_task = asyncio.create_task(tester.monitor_input(adc_ch, mux_in, interval))
+                    try:
+                        # The monitor keeps reading while we wait for input
+                        while not monitor_task.done():
+                            if (await ainput()).strip().lower() == 'q':
+                                break
+                    finally:
+                        monitor_task.cancel()
+                        try:
+                            await monitor_task
+                        except asyncio.CancelledError:
+                            pass
+                        except Exception as e:
+                            logger.error(f"Monitoring failed: {e}")
+                    print("⏹️ Monitoring stopped")
                 
-            elif choice == '5':
-                print("🔌 Disabling all multiplexers...")
-                try:
-                    await tester.gpio_service.disable_all_mux()
-                    print("✓ All multiplexers disabled successfully")
-                    print("   All MUX enable pins set to LOW")
-                    print("   Hardware is now in safe state")
-                except Exception as e:
-                    print(f"❌ Error disabling multiplexers: {e}")
+                elif choice == '5':
+                    print("🔌 Disabling all multiplexers...")
+                    try:
+                        tester.gpio_service.disable_all_mux()
+                        tester._mux_clean = True
+                        print("✓ All multiplexers disabled successfully")
+                        print("   All MUX enable pins set to LOW")
+                        print("   Hardware is now in safe state")
+                    except Exception as e:
+                        print(f"❌ Error disabling multiplexers: {e}")
                 
-            else:
-                print("❌ Invalid choice")
+                else:
+                    print("❌ Invalid choice")
             
-            print()
+                print()
             
-        except ValueError:
-            print("❌ Please enter valid numbers")
-        except KeyboardInterrupt:
-            print("\n👋 Exiting...")
-            break
-        except Exception as e:
-            logger.error(f"Test error: {e}")
-  
-    # finally:
-        # await tester.cleanup()
+            except ValueError:
+                print("❌ Please enter valid numbers")
+            except KeyboardInterrupt:
+                print("\n👋 Exiting...")
+                break
+            except Exception as e:
+                logger.error(f"Test error: {e}")
 
 async def main():
     """Main entry point"""
@@ -297,12 +537,8 @@ async def main():
             adc_ch = int(sys.argv[1])
             mux_in = int(sys.argv[2])
             
-            tester = HardwareTester()
-            # try:
-            await tester.initialize()
-            await tester.test_specific_input(adc_ch, mux_in)
-            # finally:
-            #     await tester.cleanup()
+            async with HardwareTester() as tester:
+                await tester.test_specific_input(adc_ch, mux_in)
         else:
             print("Usage: python3 test_hardware.py [adc_channel] [mux_input]")
             print("   Or: python3 test_hardware.py    (for interactive mode)")